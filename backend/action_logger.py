@@ -1,121 +1,187 @@
 # backend/action_logger.py
 
-from module import db, ActionLog
-from datetime import datetime
-import json
+from module import ActionLog
+from config import ACTION_LOG_POOL_SIZE, ACTION_LOG_BATCH_SIZE, ACTION_LOG_FLUSH_INTERVAL, AUDIT_LOG_ENABLED
+from sqlalchemy import create_engine, insert
+import orjson
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from typing import NamedTuple, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Pending ActionLog rows, written by a background worker so that request
+# handlers never wait on the audit INSERT/COMMIT
+_log_queue = queue.Queue()
+_worker_lock = threading.Lock()
+_worker = None
+_log_listener = None
+
+# Pre-encoded JSON fragments for details with a fixed shape; only the values
+# go through orjson, so no dict is built for these actions
+_PHASE_NUMBER_PREFIX = b'{"phase_number":'
+_ROLE_NAME_PREFIX = b'{"role_name":'
+_OLD_VERSION_PREFIX = b'{"old_version":'
+_NEW_VERSION_SEP = b',"new_version":'
+_SCRIPT_ID_PREFIX = b'{"script_id":'
+_SCRIPT_NAME_SEP = b',"script_name":'
+_JSON_OBJECT_END = b'}'
+
+# Row content kept in row add/delete details
+_ROW_FIELDS = ('role', 'time', 'duration', 'description', 'script')
+_ROW_DEFAULTS = dict.fromkeys(_ROW_FIELDS, '')
+
+# Core INSERT built once; executed with a list of parameter dicts per batch
+_INSERT_ACTION_LOG = insert(ActionLog.__table__)
+
+
+class LogMsg(NamedTuple):
+    """Queued action log entry, laid out like the ActionLog columns"""
+    project_id: int
+    user_name: str
+    user_role: str
+    action_type: str
+    action_details: Union[dict, bytes]
+    reset_epoch: int
+    row_id: Optional[int] = None
+    phase_id: Optional[int] = None
+    script_result: Optional[bool] = None
+
+
+def _log_worker(engine):
+    """Drain the log queue and persist entries through the logger's own engine"""
+    while True:
+        batch = [_log_queue.get()]
+        deadline = time.monotonic() + ACTION_LOG_FLUSH_INTERVAL
+        while len(batch) < ACTION_LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_log_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        params = [msg._asdict() for msg in batch]
+        try:
+            _write_batch(engine, params)
+        finally:
+            for _ in batch:
+                _log_queue.task_done()
+
+
+def _write_batch(engine, params):
+    """Insert a batch of entries, falling back to one transaction per entry on failure"""
+    try:
+        # One multi-row INSERT for everything collected in this window; timestamp is
+        # left to the server default, so the whole batch shares a single NOW()
+        with engine.begin() as conn:
+            conn.execute(_INSERT_ACTION_LOG, params)
+        return
+    except Exception:
+        if len(params) == 1:
+            # Log error but keep the worker alive
+            logger.exception('Error writing action log')
+            return
+    # One bad entry (e.g. its project was deleted meanwhile) must not take the
+    # rest of the batch with it: retry each entry on its own, only failures are lost
+    for entry in params:
+        try:
+            with engine.begin() as conn:
+                conn.execute(_INSERT_ACTION_LOG, entry)
+        except Exception:
+            logger.exception('Error writing action log')
+
+
+def _flush_on_exit(timeout=5.0):
+    """Give the worker a chance to write entries still queued at shutdown"""
+    deadline = time.monotonic() + timeout
+    while _log_queue.unfinished_tasks and _worker is not None and _worker.is_alive() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def _log(action_type, project_id, user_name, user_role, reset_epoch, action_details, **columns):
+    """Queue one ActionLog row; extra columns are row_id, phase_id or script_result
+
+    action_details is either a dict or pre-encoded JSON bytes; the JSON column's
+    json_serializer accepts both.
+    """
+    # Nothing here touches the database, so there is no failure path to guard:
+    # write errors are handled (and logged) by the worker
+    _log_queue.put(LogMsg(project_id, user_name, user_role, action_type, action_details, reset_epoch, **columns))
+
+
+def _row_details(phase_number, row_data, row_position_at_action):
+    """Build action details shared by row add/delete logs"""
+    action_details = {
+        'phase_number': phase_number
+    }
+    
+    # Store row position at action time for consistent display
+    if row_position_at_action is not None:
+        action_details['row_position_at_action'] = row_position_at_action
+    
+    # Add row content if provided
+    if row_data:
+        action_details['row_data'] = {**_ROW_DEFAULTS, **{k: row_data[k] for k in _ROW_FIELDS if k in row_data}}
+    return action_details
 
 
 class ActionLogger:
     """Class for logging user actions to the database"""
     
+    @staticmethod
+    def init_app(app):
+        """Start the background threads that write queued action logs and logger errors"""
+        global _worker, _log_listener
+        if not AUDIT_LOG_ENABLED:
+            return
+        with _worker_lock:
+            if _log_listener is None:
+                # Error reports are written to stderr by a listener thread, not the caller
+                records = queue.Queue(-1)
+                _log_listener = logging.handlers.QueueListener(records, logging.StreamHandler())
+                _log_listener.start()
+                logger.addHandler(logging.handlers.QueueHandler(records))
+                logger.propagate = False
+            if _worker is None or not _worker.is_alive():
+                # Separate small pool so audit writes never take connections from request handlers
+                engine_options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+                engine_options.update(pool_size=ACTION_LOG_POOL_SIZE, max_overflow=0)
+                engine = create_engine(app.config['SQLALCHEMY_DATABASE_URI'], **engine_options)
+                _worker = threading.Thread(target=_log_worker, args=(engine,), name='action-logger', daemon=True)
+                _worker.start()
+                atexit.register(_flush_on_exit)
+    
     @staticmethod
     def log_row_status_change(project_id, user_name, user_role, row_id, old_status, new_status, reset_epoch):
         """Log a row status change action"""
-        try:
-            action_details = {
-                'old_status': old_status,
-                'new_status': new_status,
-                'row_id': row_id
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='row_status_change',
-                action_details=json.dumps(action_details),
-                row_id=row_id,
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            # Log error but don't break main functionality
-            print(f'Error logging row status change: {e}')
-            db.session.rollback()
+        _log('row_status_change', project_id, user_name, user_role, reset_epoch,
+             {'old_status': old_status, 'new_status': new_status},
+             row_id=row_id)
     
     @staticmethod
     def log_script_execution(project_id, user_name, user_role, row_id, script_path, result, reset_epoch):
         """Log a script execution action"""
-        try:
-            action_details = {
-                'script_path': script_path,
-                'row_id': row_id
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='script_execution',
-                action_details=json.dumps(action_details),
-                script_result=result,
-                row_id=row_id,
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            # Log error but don't break main functionality
-            print(f'Error logging script execution: {e}')
-            db.session.rollback()
+        _log('script_execution', project_id, user_name, user_role, reset_epoch,
+             {'script_path': script_path},
+             script_result=result, row_id=row_id)
     
     @staticmethod
     def log_phase_activation(project_id, user_name, user_role, phase_id, phase_number, is_active, reset_epoch):
         """Log a phase activation/deactivation action"""
-        try:
-            action_details = {
-                'phase_number': phase_number,
-                'is_active': is_active
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='phase_activation',
-                action_details=json.dumps(action_details),
-                phase_id=phase_id,
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            # Log error but don't break main functionality
-            print(f'Error logging phase activation: {e}')
-            db.session.rollback()
+        _log('phase_activation', project_id, user_name, user_role, reset_epoch,
+             {'phase_number': phase_number, 'is_active': is_active},
+             phase_id=phase_id)
     
     @staticmethod
     def log_reset_statuses(project_id, user_name, user_role, rows_count, reset_epoch):
         """Log a reset all statuses action"""
-        try:
-            action_details = {
-                'rows_count': rows_count,
-                'new_status': 'N/A'
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='reset_statuses',
-                action_details=json.dumps(action_details),
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            # Log error but don't break main functionality
-            print(f'Error logging reset statuses: {e}')
-            db.session.rollback()
+        _log('reset_statuses', project_id, user_name, user_role, reset_epoch,
+             {'rows_count': rows_count, 'new_status': 'N/A'})
     
     @staticmethod
     def log_row_edit(project_id, user_name, user_role, row_id, phase_number, old_data=None, new_data=None, reset_epoch=0):
@@ -131,34 +197,17 @@ class ActionLogger:
             new_data: Dict of new field values (only changed fields)
             reset_epoch: Reset epoch number
         """
-        try:
-            action_details = {
-                'row_id': row_id,
-                'phase_number': phase_number
-            }
-            
-            # Add old_data and new_data if provided
-            if old_data is not None:
-                action_details['old_data'] = old_data
-            if new_data is not None:
-                action_details['new_data'] = new_data
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='row_edit',
-                action_details=json.dumps(action_details),
-                row_id=row_id,
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging row edit: {e}')
-            db.session.rollback()
+        action_details = {
+            'phase_number': phase_number
+        }
+        
+        # Add old_data and new_data if provided
+        if old_data is not None:
+            action_details['old_data'] = old_data
+        if new_data is not None:
+            action_details['new_data'] = new_data
+        
+        _log('row_edit', project_id, user_name, user_role, reset_epoch, action_details, row_id=row_id)
     
     @staticmethod
     def log_row_add(project_id, user_name, user_role, row_id, phase_number, reset_epoch, row_data=None, row_position_at_action=None):
@@ -174,42 +223,9 @@ class ActionLogger:
             row_data: Optional dict with row content (role, time, duration, description, script)
             row_position_at_action: The 1-based row number at the time of the action (for consistent display)
         """
-        try:
-            action_details = {
-                'row_id': row_id,
-                'phase_number': phase_number
-            }
-            
-            # Store row position at action time for consistent display
-            if row_position_at_action is not None:
-                action_details['row_position_at_action'] = row_position_at_action
-            
-            # Add row content if provided
-            if row_data:
-                action_details['row_data'] = {
-                    'role': row_data.get('role', ''),
-                    'time': row_data.get('time', ''),
-                    'duration': row_data.get('duration', ''),
-                    'description': row_data.get('description', ''),
-                    'script': row_data.get('script', '')
-                }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='row_add',
-                action_details=json.dumps(action_details),
-                row_id=row_id,
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging row add: {e}')
-            db.session.rollback()
+        _log('row_add', project_id, user_name, user_role, reset_epoch,
+             _row_details(phase_number, row_data, row_position_at_action),
+             row_id=row_id)
     
     @staticmethod
     def log_row_delete(project_id, user_name, user_role, row_id, phase_number, reset_epoch, row_data=None, row_position_at_action=None):
@@ -225,69 +241,16 @@ class ActionLogger:
             row_data: Optional dict with row content (role, time, duration, description, script)
             row_position_at_action: The 1-based row number at the time of the action (for consistent display)
         """
-        try:
-            action_details = {
-                'row_id': row_id,
-                'phase_number': phase_number
-            }
-            
-            # Store row position at action time for consistent display
-            if row_position_at_action is not None:
-                action_details['row_position_at_action'] = row_position_at_action
-            
-            # Add row content if provided
-            if row_data:
-                action_details['row_data'] = {
-                    'role': row_data.get('role', ''),
-                    'time': row_data.get('time', ''),
-                    'duration': row_data.get('duration', ''),
-                    'description': row_data.get('description', ''),
-                    'script': row_data.get('script', '')
-                }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='row_delete',
-                action_details=json.dumps(action_details),
-                row_id=row_id,
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging row delete: {e}')
-            db.session.rollback()
+        _log('row_delete', project_id, user_name, user_role, reset_epoch,
+             _row_details(phase_number, row_data, row_position_at_action),
+             row_id=row_id)
     
     @staticmethod
     def log_row_duplicate(project_id, user_name, user_role, source_row_id, new_row_id, phase_number, reset_epoch):
         """Log a row duplication"""
-        try:
-            action_details = {
-                'source_row_id': source_row_id,
-                'new_row_id': new_row_id,
-                'phase_number': phase_number
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='row_duplicate',
-                action_details=json.dumps(action_details),
-                row_id=new_row_id,
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging row duplicate: {e}')
-            db.session.rollback()
+        _log('row_duplicate', project_id, user_name, user_role, reset_epoch,
+             {'source_row_id': source_row_id, 'new_row_id': new_row_id, 'phase_number': phase_number},
+             row_id=new_row_id)
     
     @staticmethod
     def log_row_move(project_id, user_name, user_role, row_id, source_phase, target_phase, old_index=None, new_index=None, row_position_at_move=None, reset_epoch=0):
@@ -297,7 +260,7 @@ class ActionLogger:
             project_id: Project ID
             user_name: User name
             user_role: User role
-            row_id: Row ID (new row ID after move)
+            row_id: Row ID (stored in the row_id column)
             source_phase: Source phase number
             target_phase: Target phase number
             old_index: Old position index (0-based, optional)
@@ -305,234 +268,72 @@ class ActionLogger:
             row_position_at_move: Row's position number at time of move (1-based, for display)
             reset_epoch: Reset epoch number
         """
-        try:
-            action_details = {
-                'row_id': row_id,
-                'source_phase': source_phase,
-                'target_phase': target_phase
-            }
-            
-            # Add index information if provided
-            if old_index is not None:
-                action_details['old_index'] = old_index
-            if new_index is not None:
-                action_details['new_index'] = new_index
-            # Store row position at time of move for PDF display (since row IDs change on recreation)
-            if row_position_at_move is not None:
-                action_details['row_position'] = row_position_at_move
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='row_move',
-                action_details=json.dumps(action_details),
-                row_id=row_id,
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging row move: {e}')
-            db.session.rollback()
+        action_details = {
+            'source_phase': source_phase,
+            'target_phase': target_phase
+        }
+        
+        # Add index information if provided
+        if old_index is not None:
+            action_details['old_index'] = old_index
+        if new_index is not None:
+            action_details['new_index'] = new_index
+        # Store row position at time of move for PDF display (later moves and deletes shift positions)
+        if row_position_at_move is not None:
+            action_details['row_position'] = row_position_at_move
+        
+        _log('row_move', project_id, user_name, user_role, reset_epoch, action_details, row_id=row_id)
     
     @staticmethod
     def log_phase_add(project_id, user_name, user_role, phase_id, phase_number, reset_epoch):
         """Log a phase creation"""
-        try:
-            action_details = {
-                'phase_number': phase_number
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='phase_add',
-                action_details=json.dumps(action_details),
-                phase_id=phase_id,
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging phase add: {e}')
-            db.session.rollback()
+        _log('phase_add', project_id, user_name, user_role, reset_epoch,
+             _PHASE_NUMBER_PREFIX + orjson.dumps(phase_number) + _JSON_OBJECT_END, phase_id=phase_id)
     
     @staticmethod
     def log_phase_delete(project_id, user_name, user_role, phase_id, phase_number, reset_epoch):
         """Log a phase deletion"""
-        try:
-            action_details = {
-                'phase_number': phase_number
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='phase_delete',
-                action_details=json.dumps(action_details),
-                phase_id=phase_id,
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging phase delete: {e}')
-            db.session.rollback()
+        _log('phase_delete', project_id, user_name, user_role, reset_epoch,
+             _PHASE_NUMBER_PREFIX + orjson.dumps(phase_number) + _JSON_OBJECT_END, phase_id=phase_id)
     
     @staticmethod
     def log_version_update(project_id, user_name, user_role, old_version, new_version, reset_epoch):
         """Log a version change"""
-        try:
-            action_details = {
-                'old_version': old_version,
-                'new_version': new_version
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='version_update',
-                action_details=json.dumps(action_details),
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging version update: {e}')
-            db.session.rollback()
+        _log('version_update', project_id, user_name, user_role, reset_epoch,
+             _OLD_VERSION_PREFIX + orjson.dumps(old_version) + _NEW_VERSION_SEP + orjson.dumps(new_version) + _JSON_OBJECT_END)
     
     @staticmethod
     def log_role_add(project_id, user_name, user_role, role_name, reset_epoch):
         """Log a role addition"""
-        try:
-            action_details = {
-                'role_name': role_name
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='role_add',
-                action_details=json.dumps(action_details),
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging role add: {e}')
-            db.session.rollback()
+        _log('role_add', project_id, user_name, user_role, reset_epoch,
+             _ROLE_NAME_PREFIX + orjson.dumps(role_name) + _JSON_OBJECT_END)
     
     @staticmethod
     def log_role_delete(project_id, user_name, user_role, role_name, reset_epoch):
         """Log a role deletion"""
-        try:
-            action_details = {
-                'role_name': role_name
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='role_delete',
-                action_details=json.dumps(action_details),
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging role delete: {e}')
-            db.session.rollback()
+        _log('role_delete', project_id, user_name, user_role, reset_epoch,
+             _ROLE_NAME_PREFIX + orjson.dumps(role_name) + _JSON_OBJECT_END)
     
     @staticmethod
     def log_script_add(project_id, user_name, user_role, script_id, script_name, reset_epoch):
         """Log a periodic script creation"""
-        try:
-            action_details = {
-                'script_id': script_id,
-                'script_name': script_name
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='script_add',
-                action_details=json.dumps(action_details),
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging script add: {e}')
-            db.session.rollback()
+        _log('script_add', project_id, user_name, user_role, reset_epoch,
+             _SCRIPT_ID_PREFIX + orjson.dumps(script_id) + _SCRIPT_NAME_SEP + orjson.dumps(script_name) + _JSON_OBJECT_END)
     
     @staticmethod
     def log_script_update(project_id, user_name, user_role, script_id, script_name, reset_epoch):
         """Log a periodic script update"""
-        try:
-            action_details = {
-                'script_id': script_id,
-                'script_name': script_name
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='script_update',
-                action_details=json.dumps(action_details),
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging script update: {e}')
-            db.session.rollback()
+        _log('script_update', project_id, user_name, user_role, reset_epoch,
+             _SCRIPT_ID_PREFIX + orjson.dumps(script_id) + _SCRIPT_NAME_SEP + orjson.dumps(script_name) + _JSON_OBJECT_END)
     
     @staticmethod
     def log_script_delete(project_id, user_name, user_role, script_id, script_name, reset_epoch):
         """Log a periodic script deletion"""
-        try:
-            action_details = {
-                'script_id': script_id,
-                'script_name': script_name
-            }
-            
-            action_log = ActionLog(
-                project_id=project_id,
-                user_name=user_name,
-                user_role=user_role,
-                action_type='script_delete',
-                action_details=json.dumps(action_details),
-                reset_epoch=reset_epoch,
-                timestamp=datetime.utcnow()
-            )
-            
-            db.session.add(action_log)
-            db.session.commit()
-        except Exception as e:
-            print(f'Error logging script delete: {e}')
-            db.session.rollback()
+        _log('script_delete', project_id, user_name, user_role, reset_epoch,
+             _SCRIPT_ID_PREFIX + orjson.dumps(script_id) + _SCRIPT_NAME_SEP + orjson.dumps(script_name) + _JSON_OBJECT_END)
+
 
+if not AUDIT_LOG_ENABLED:
+    # Audit logging is off: turn every log_* into a no-op at import time
+    for _name in [name for name in vars(ActionLogger) if name.startswith('log_')]:
+        setattr(ActionLogger, _name, staticmethod(lambda *args, **kwargs: None))
@@ -1,19 +1,35 @@
 # backend/api.py
 
-from flask import Blueprint, request, jsonify, current_app, send_file
+from flask import Blueprint, request, current_app, send_file, abort
 import os
 from module import db, Project, Phase, Row, PeriodicScript, ProjectRole, User, PendingChange, Message, ActionLog, RelatedDocument
-from sqlalchemy import func, text
-from sqlalchemy.orm import joinedload
+from sqlalchemy import case, func, insert, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import defer, joinedload, load_only, selectinload
+from sqlalchemy.orm.attributes import flag_modified
+from werkzeug.http import generate_etag
+from werkzeug.security import check_password_hash
 from datetime import datetime, timedelta
-import json
+import orjson
+import random
 import uuid
 import requests
 from action_logger import ActionLogger
+from row_import import parse_rows, build_row_dicts
 from openpyxl import Workbook
 from io import BytesIO
 
-api = Blueprint('api', __name__)
+api = Blueprint('api', __name__, url_prefix='/api')
+
+# Core INSERTs for the bulk paths, built once and reused for every executemany
+_INSERT_PHASE = insert(Phase.__table__)
+_INSERT_ROW = insert(Row.__table__)
+_INSERT_PROJECT_ROLE = insert(ProjectRole.__table__)
+
+# PyMySQL runs an UPDATE executemany as one statement per row; from this many rows
+# on they are merged into CASE statements, and each statement covers at most a chunk
+_MERGED_UPDATE_MIN_ROWS = 8
+_MERGED_UPDATE_CHUNK = 500
 
 
 def get_socketio():
@@ -27,23 +43,81 @@ def get_socketio():
         return None
 
 
+def make_json_response(data, status=200):
+    """Build a JSON response with orjson instead of the stdlib json encoder"""
+    return current_app.response_class(
+        orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def dumps_json_text(data):
+    """Serialize data for the JSON text columns (clock and notification data) with orjson"""
+    return orjson.dumps(data).decode()
+
+
+def make_cached_json_response(data):
+    """Build a JSON response with an ETag of its body; answers 304 when the client copy is current"""
+    response = make_json_response(data, 200)
+    # Weak, because Flask-Compress appends the encoding to strong ETags: the client
+    # would send back "<hash>:br", which never matches here, and every unchanged poll
+    # would be compressed before Compress itself turned it into a 304
+    response.add_etag(weak=True)
+    # Clients reload on Socket.IO events, so a cached copy is always revalidated (never
+    # served stale for a max-age) and proxies must not share it between users
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _get_project(project_id):
+    """Load a project with only the columns that manager checks and action logging read"""
+    return db.session.get(Project, project_id, options=[load_only(Project.manager_role, Project.reset_epoch)])
+
+
+def _get_project_or_404(project_id):
+    """Like _get_project(), aborting with 404 when the project does not exist"""
+    project = _get_project(project_id)
+    if project is None:
+        abort(404)
+    return project
+
+
+def _project_exists_or_404(project_id):
+    """Abort with 404 unless the project exists, without loading the Project object"""
+    if db.session.query(Project.id).filter_by(id=project_id).scalar() is None:
+        abort(404)
+
+
 # ==================== PROJECT ENDPOINTS ====================
 
-@api.route('/api/projects', methods=['GET'])
+@api.route('/projects', methods=['GET'])
 def get_projects():
     """Get all projects"""
-    projects = Project.query.all()
-    return jsonify([project.to_dict() for project in projects]), 200
-
-
-@api.route('/api/projects/<int:project_id>', methods=['GET'])
+    # Plain column selects instead of ORM objects; the dicts match Project.to_dict()
+    roles_by_project = {}
+    for project_id, role_name in db.session.execute(select(ProjectRole.project_id, ProjectRole.role_name).order_by(ProjectRole.project_id, ProjectRole.role_name)):
+        roles_by_project.setdefault(project_id, []).append(role_name)
+    projects = db.session.execute(select(
+        Project.id, Project.name, Project.version,
+        Project.manager_password_hash.isnot(None).label('is_locked'),
+        Project.manager_role, Project.clock_command, Project.clock_command_data, Project.clock_command_timestamp
+    )).mappings()
+    return make_cached_json_response([
+        dict(project, roles=roles_by_project.get(project['id'], [])) for project in projects
+    ])
+
+
+@api.route('/projects/<int:project_id>', methods=['GET'])
 def get_project(project_id):
     """Get a specific project"""
-    project = Project.query.get_or_404(project_id)
-    return jsonify(project.to_dict()), 200
+    # to_dict() lists the roles; join them into the same query
+    project = Project.query.options(joinedload(Project.roles)).get_or_404(project_id)
+    return make_cached_json_response(project.to_dict())
 
 
-@api.route('/api/projects/<int:project_id>/version', methods=['PUT'])
+@api.route('/projects/<int:project_id>/version', methods=['PUT'])
 def update_project_version(project_id):
     """Update project version"""
     project = Project.query.get_or_404(project_id)
@@ -51,7 +125,6 @@ def update_project_version(project_id):
     old_version = project.version
     new_version = data.get('version', project.version)
     project.version = new_version
-    project.updated_at = datetime.utcnow()
     db.session.commit()
     
     # Log version update (only if user is manager and version actually changed)
@@ -60,10 +133,10 @@ def update_project_version(project_id):
     if project.manager_role == user_role and old_version != new_version:
         ActionLogger.log_version_update(project.id, user_name, user_role, old_version, new_version, project.reset_epoch)
     
-    return jsonify(project.to_dict()), 200
+    return make_json_response(project.to_dict(), 200)
 
 
-@api.route('/api/projects/<int:project_id>/clock-command', methods=['POST'])
+@api.route('/projects/<int:project_id>/clock-command', methods=['POST'])
 def create_clock_command(project_id):
     """Create a clock command that will be applied by all clients"""
     project = Project.query.get_or_404(project_id)
@@ -72,27 +145,41 @@ def create_clock_command(project_id):
     command = data.get('command')  # 'set_time', 'start', 'stop', 'set_target', 'clear_target'
     command_data = data.get('data', {})
     
-    import json
     project.clock_command = command
-    project.clock_command_data = json.dumps(command_data) if command_data else None
+    project.clock_command_data = dumps_json_text(command_data) if command_data else None
     project.clock_command_timestamp = datetime.utcnow()
-    project.updated_at = datetime.utcnow()
     db.session.commit()
-    return jsonify(project.to_dict()), 200
+    return make_json_response(project.to_dict(), 200)
 
 
-@api.route('/api/projects/<int:project_id>/clock-command', methods=['GET'])
+@api.route('/projects/<int:project_id>/clock-command', methods=['GET'])
 def get_clock_command(project_id):
     """Get the latest clock command (used by clients to sync)"""
-    project = Project.query.get_or_404(project_id)
-    return jsonify({
-        'command': project.clock_command,
-        'data': json.loads(project.clock_command_data) if project.clock_command_data else None,
-        'timestamp': project.clock_command_timestamp.isoformat() if project.clock_command_timestamp else None
-    }), 200
+    # Every client polls this; read only the command columns and answer 304 before
+    # decoding or serializing anything when the client already has this command
+    command = db.session.execute(
+        select(Project.clock_command, Project.clock_command_data, Project.clock_command_timestamp)
+        .where(Project.id == project_id)
+    ).first()
+    if command is None:
+        abort(404)
+    clock_command, clock_command_data, clock_command_timestamp = command
+    etag = generate_etag(orjson.dumps([clock_command, clock_command_data, clock_command_timestamp]))
+    # Weak for the same reason as make_cached_json_response: Compress leaves it unchanged
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_json_response({
+            'command': clock_command,
+            # Stored as JSON text; embedded as-is instead of parsed and re-encoded
+            'data': orjson.Fragment(clock_command_data) if clock_command_data else None,
+            'timestamp': clock_command_timestamp.isoformat() if clock_command_timestamp else None
+        }, 200)
+    response.set_etag(etag, weak=True)
+    return response
 
 
-@api.route('/api/timer/<int:project_id>', methods=['GET'])
+@api.route('/timer/<int:project_id>', methods=['GET'])
 def get_timer_state(project_id):
     """Get the current persistent timer state for Socket.IO-based timer"""
     project = Project.query.get_or_404(project_id)
@@ -103,16 +190,16 @@ def get_timer_state(project_id):
         elapsed_since_start = int((datetime.utcnow() - project.timer_last_start_time).total_seconds())
         seconds_elapsed += elapsed_since_start
     
-    return jsonify({
+    return make_json_response({
         'isRunning': project.timer_is_running,
         'lastStartTime': (project.timer_last_start_time.isoformat() + 'Z') if project.timer_last_start_time else None,
         'initialOffset': project.timer_initial_offset,
         'targetDateTime': (project.timer_target_datetime.isoformat() + 'Z') if project.timer_target_datetime else None,
         'secondsElapsed': seconds_elapsed
-    }), 200
+    }, 200)
 
 
-@api.route('/api/projects/<int:project_id>/clock-command/clear', methods=['POST'])
+@api.route('/projects/<int:project_id>/clock-command/clear', methods=['POST'])
 def clear_clock_command(project_id):
     """Clear the clock command after it's been processed"""
     project = Project.query.get_or_404(project_id)
@@ -120,27 +207,108 @@ def clear_clock_command(project_id):
     project.clock_command_data = None
     project.clock_command_timestamp = None
     db.session.commit()
-    return jsonify({'message': 'Command cleared'}), 200
+    return make_json_response({'message': 'Command cleared'}, 200)
+
+
+def _insert_phases(project_id, phase_mappings):
+    """Insert new phases of a project in one executemany and return {phase_number: id}
+
+    MySQL has no INSERT ... RETURNING, so the generated ids are read back with a
+    single SELECT instead of one INSERT round trip per phase.
+    """
+    if not phase_mappings:
+        return {}
+    db.session.execute(_INSERT_PHASE, phase_mappings)
+    phase_numbers = [mapping['phase_number'] for mapping in phase_mappings]
+    return dict(db.session.execute(
+        select(Phase.phase_number, Phase.id)
+        .where(Phase.project_id == project_id, Phase.phase_number.in_(phase_numbers))
+    ).all())
+
+
+def _insert_rows(row_mappings, known_row_ids):
+    """Insert rows in one executemany and fill in each mapping's 'id'
+
+    As in _insert_phases, the ids are read back with one SELECT: the rows of the
+    target phases that are not in known_row_ids are the new ones, and since the
+    ids of an INSERT increase in row order they match each phase's mappings in order.
+
+    That only holds if no other transaction can add rows to those phases meanwhile.
+    The caller must hold FOR UPDATE locks on the existing target phases, taken before
+    known_row_ids was read (an INSERT into a phase needs a shared lock on it for the
+    foreign key, so it waits for this commit); phases created in the same transaction
+    are not visible to others yet. This does not depend on the isolation level.
+    """
+    if not row_mappings:
+        return
+    db.session.execute(_INSERT_ROW, row_mappings)
+    new_ids_by_phase = {}
+    for row_id, phase_id in db.session.execute(
+        select(Row.id, Row.phase_id)
+        .where(Row.phase_id.in_({mapping['phase_id'] for mapping in row_mappings}))
+        .order_by(Row.id)
+    ):
+        if row_id not in known_row_ids:
+            new_ids_by_phase.setdefault(phase_id, []).append(row_id)
+    for phase_ids in new_ids_by_phase.values():
+        phase_ids.reverse()
+    for mapping in row_mappings:
+        mapping['id'] = new_ids_by_phase[mapping['phase_id']].pop()
+
+
+def _update_rows(row_updates):
+    """Write row mappings ({'id': ..., column: value}) that all share the same keys
+
+    Large batches become UPDATE rows SET col = CASE id WHEN ... END ... WHERE id IN (...),
+    one round trip per chunk instead of one per row. Like bulk_update_mappings,
+    this does not touch Row objects already loaded in the session.
+    """
+    if len(row_updates) < _MERGED_UPDATE_MIN_ROWS:
+        db.session.bulk_update_mappings(Row, row_updates)
+        return
+    table = Row.__table__
+    columns = [key for key in row_updates[0] if key != 'id']
+    for start in range(0, len(row_updates), _MERGED_UPDATE_CHUNK):
+        chunk = row_updates[start:start + _MERGED_UPDATE_CHUNK]
+        db.session.execute(
+            update(table)
+            .where(table.c.id.in_([mapping['id'] for mapping in chunk]))
+            .values({
+                key: case({mapping['id']: mapping[key] for mapping in chunk}, value=table.c.id)
+                for key in columns
+            })
+        )
+
+
+def _count_remaining_pending(project_id, submission_id):
+    """Count a submission's changes still pending review, excluding the internal table_data entry"""
+    # A plain COUNT; Query.count() would wrap a select of every column, changes_data included
+    return db.session.query(func.count(PendingChange.id)).filter(
+        PendingChange.project_id == project_id,
+        PendingChange.submission_id == submission_id,
+        PendingChange.status == 'pending',
+        PendingChange.change_type != 'table_data'
+    ).scalar()
 
 
-@api.route('/api/projects/import', methods=['POST'])
+@api.route('/projects/import', methods=['POST'])
 def import_project():
     """Create a new project from uploaded rows"""
     data = request.get_json()
+    if not isinstance(data, dict):
+        return make_json_response({'error': 'Invalid request format'}, 400)
     name = (data.get('name') or '').strip()
     rows_data = data.get('rows') or []
     manager_password = (data.get('managerPassword') or '').strip()
     manager_role = (data.get('managerRole') or '').strip()
 
     if not name:
-        return jsonify({'error': 'Project name is required'}), 400
+        return make_json_response({'error': 'Project name is required'}, 400)
     if not rows_data:
-        return jsonify({'error': 'No rows data provided'}), 400
-
-    existing_project = Project.query.filter(func.lower(Project.name) == name.lower()).first()
-    if existing_project:
-        return jsonify({'error': 'Project with this name already exists'}), 400
+        return make_json_response({'error': 'No rows data provided'}, 400)
 
+    # Name uniqueness is enforced by the unique index on projects.name; its
+    # utf8mb4_unicode_ci collation makes the comparison case-insensitive
     try:
         project = Project(name=name)
         if manager_password:
@@ -148,82 +316,67 @@ def import_project():
         if manager_role:
             project.manager_role = manager_role
         db.session.add(project)
-        db.session.flush()
-
-        role_names = set()
-        phases_cache = {}
-
-        for row in rows_data:
-            phase_number = row.get('phase')
-            if phase_number is None or phase_number == '':
-                continue
-            try:
-                phase_number = int(phase_number)
-            except ValueError:
-                continue
-
-            if phase_number not in phases_cache:
-                phase = Phase(
-                    project_id=project.id,
-                    phase_number=phase_number,
-                    is_active=False
-                )
-                db.session.add(phase)
-                db.session.flush()
-                phases_cache[phase_number] = phase
-
-            role_value = (row.get('role') or 'Role').strip() or 'Role'
-            time_value = row.get('time') or '00:00:00'
-            duration_value = row.get('duration') or '00:00'
-            description_value = row.get('description') or ''
-
-            db.session.add(Row(
-                phase_id=phases_cache[phase_number].id,
-                role=role_value,
-                time=time_value,
-                duration=duration_value,
-                description=description_value,
-                script=row.get('script') or '',
-                status=row.get('status') or 'N/A',
-                script_result=row.get('scriptResult')
-            ))
-
-            role_names.add(role_value)
-
-        for role_name in role_names:
-            db.session.add(ProjectRole(project_id=project.id, role_name=role_name))
+        try:
+            db.session.flush()
+        except IntegrityError:
+            # The project INSERT can only conflict on the name
+            db.session.rollback()
+            return make_json_response({'error': 'Project with this name already exists'}, 400)
+
+        # Pass 1: keep rows with a usable phase number, parsed once
+        parsed_rows = parse_rows(rows_data)
+
+        # Pass 2: one phase per distinct number (in first-seen order), inserted at once
+        phase_ids = _insert_phases(project.id, [
+            {'project_id': project.id, 'phase_number': phase_number, 'is_active': False}
+            for phase_number in dict.fromkeys(phase_number for phase_number, _ in parsed_rows)
+        ])
+
+        # Pass 3: row mappings and the distinct role names
+        row_mappings, role_names = build_row_dicts(parsed_rows, phase_ids)
+
+        # Core executemany: PyMySQL sends these as multi-row INSERT ... VALUES statements
+        if row_mappings:
+            db.session.execute(_INSERT_ROW, row_mappings)
+        if role_names:
+            db.session.execute(_INSERT_PROJECT_ROLE, [
+                {'project_id': project.id, 'role_name': role_name} for role_name in role_names
+            ])
 
         db.session.commit()
-        created_project = Project.query.get(project.id)
-        return jsonify(created_project.to_dict()), 201
+        return make_json_response(project.to_dict(), 201)
     except Exception as exc:
         db.session.rollback()
-        return jsonify({'error': str(exc)}), 500
+        return make_json_response({'error': str(exc)}, 500)
 
 
-@api.route('/api/projects/<int:project_id>/verify-manager', methods=['POST'])
+@api.route('/projects/<int:project_id>/verify-manager', methods=['POST'])
 def verify_manager_password(project_id):
     """Verify manager password for locked projects"""
-    project = Project.query.get_or_404(project_id)
+    # Only the hash column is needed; the cost here should be the hash check, not the load
+    project = db.session.execute(select(Project.manager_password_hash).where(Project.id == project_id)).first()
+    if project is None:
+        abort(404)
     data = request.get_json() or {}
     password = data.get('password', '')
 
     if not project.manager_password_hash:
-        return jsonify({'success': True, 'locked': False}), 200
+        return make_json_response({'success': True, 'locked': False}, 200)
 
-    if project.check_manager_password(password):
-        return jsonify({'success': True, 'locked': True}), 200
+    # Same rule as Project.check_manager_password: an empty password never matches
+    if password and check_password_hash(project.manager_password_hash, password):
+        return make_json_response({'success': True, 'locked': True}, 200)
 
-    return jsonify({'success': False, 'locked': True}), 401
+    return make_json_response({'success': False, 'locked': True}, 401)
 
 
-@api.route('/api/projects/<int:project_id>/export-excel', methods=['GET'])
+@api.route('/projects/<int:project_id>/export-excel', methods=['GET'])
 def export_project_excel(project_id):
     """Export project rows to Excel file matching import format"""
     project = Project.query.get_or_404(project_id)
     
     # Get all phases with rows, ordered by phase number
-    phases = Phase.query.options(joinedload(Phase.rows)).filter_by(project_id=project_id).order_by(Phase.phase_number).all()
+    phases = Phase.query.options(selectinload(Phase.rows)).filter_by(project_id=project_id).order_by(Phase.phase_number).all()
     
     # Create workbook
     wb = Workbook()
@@ -263,29 +416,49 @@ def export_project_excel(project_id):
     )
 
 
-@api.route('/api/projects/<int:project_id>', methods=['DELETE'])
+@api.route('/projects/<int:project_id>', methods=['DELETE'])
 def delete_project(project_id):
     """Delete an entire project"""
     project = Project.query.get_or_404(project_id)
     db.session.delete(project)
     db.session.commit()
-    return jsonify({'message': 'Project deleted'}), 200
+    return make_json_response({'message': 'Project deleted'}, 200)
 
 
 # ==================== PHASE ENDPOINTS ====================
 
-@api.route('/api/projects/<int:project_id>/phases', methods=['GET'])
+@api.route('/projects/<int:project_id>/phases', methods=['GET'])
 def get_phases(project_id):
     """Get all phases for a project"""
-    # Use joinedload to eagerly load rows and avoid N+1 queries
-    phases = Phase.query.options(joinedload(Phase.rows)).filter_by(project_id=project_id).order_by(Phase.phase_number).all()
-    return jsonify([phase.to_dict() for phase in phases]), 200
+    # Two plain column selects (phases, then all their rows) instead of ORM objects;
+    # the dicts match Phase.to_dict() and Row.to_dict()
+    phases = [dict(phase, rows=[]) for phase in db.session.execute(
+        select(Phase.id, Phase.project_id, Phase.phase_number.label('phase'), Phase.is_active)
+        .where(Phase.project_id == project_id)
+        .order_by(Phase.phase_number)
+    ).mappings()]
+    rows_by_phase = {phase['id']: phase['rows'] for phase in phases}
+    rows = db.session.execute(
+        select(
+            Row.phase_id, Row.id, Row.role, Row.time, Row.duration,
+            func.coalesce(Row.description, '').label('description'),
+            func.coalesce(Row.script, '').label('script'),
+            Row.status, Row.script_result.label('scriptResult')
+        )
+        .join(Phase, Phase.id == Row.phase_id)
+        .where(Phase.project_id == project_id)
+        .order_by(Row.phase_id, Row.updated_at, Row.id)
+    ).mappings()
+    for row in rows:
+        row = dict(row)
+        rows_by_phase[row.pop('phase_id')].append(row)
+    return make_cached_json_response(phases)
 
 
-@api.route('/api/projects/<int:project_id>/phases', methods=['POST'])
+@api.route('/projects/<int:project_id>/phases', methods=['POST'])
 def create_phase(project_id):
     """Create a new phase"""
-    project = Project.query.get_or_404(project_id)
+    project = _get_project_or_404(project_id)
     data = request.get_json()
     
     # Find the next phase number
@@ -306,10 +479,10 @@ def create_phase(project_id):
     if project.manager_role == user_role:
         ActionLogger.log_phase_add(project.id, user_name, user_role, phase.id, phase_number, project.reset_epoch)
     
-    return jsonify(phase.to_dict()), 201
+    return make_json_response(phase.to_dict(), 201)
 
 
-@api.route('/api/phases/<int:phase_id>', methods=['DELETE'])
+@api.route('/phases/<int:phase_id>', methods=['DELETE'])
 def delete_phase(phase_id):
     """Delete a phase"""
     phase = Phase.query.get_or_404(phase_id)
@@ -325,10 +498,10 @@ def delete_phase(phase_id):
     
     db.session.delete(phase)
     db.session.commit()
-    return jsonify({'message': 'Phase deleted'}), 200
+    return make_json_response({'message': 'Phase deleted'}, 200)
 
 
-@api.route('/api/phases/<int:phase_id>/toggle-active', methods=['PUT'])
+@api.route('/phases/<int:phase_id>/toggle-active', methods=['PUT'])
 def toggle_phase_active(phase_id):
     """Toggle phase active status"""
     phase = Phase.query.get_or_404(phase_id)
@@ -337,13 +510,12 @@ def toggle_phase_active(phase_id):
     # Get old status before toggle
     old_is_active = phase.is_active
     phase.is_active = not phase.is_active
-    phase.updated_at = datetime.utcnow()
     db.session.commit()
     
     # Log phase activation (only if user is manager)
     user_name = data.get('user_name', 'Unknown')
     user_role = data.get('user_role', 'Unknown')
-    project = Project.query.get(phase.project_id)
+    project = _get_project(phase.project_id)
     
     # Only log if user is manager
     if project and project.manager_role == user_role:
@@ -362,12 +534,12 @@ def toggle_phase_active(phase_id):
     if socketio:
         socketio.emit('phases_updated', {'project_id': phase.project_id}, room=f'project_{phase.project_id}')
     
-    return jsonify(phase.to_dict()), 200
+    return make_json_response(phase.to_dict(), 200)
 
 
 # ==================== ROW ENDPOINTS ====================
 
-@api.route('/api/phases/<int:phase_id>/rows', methods=['POST'])
+@api.route('/phases/<int:phase_id>/rows', methods=['POST'])
 def create_row(phase_id):
     """Create a new row in a phase"""
     phase = Phase.query.get_or_404(phase_id)
@@ -411,10 +583,10 @@ def create_row(phase_id):
                 break
         ActionLogger.log_row_add(project.id, user_name, user_role, row.id, phase.phase_number, project.reset_epoch, row_data=row_data, row_position_at_action=row_position_at_action)
     
-    return jsonify(row.to_dict()), 201
+    return make_json_response(row.to_dict(), 201)
 
 
-@api.route('/api/rows/<int:row_id>', methods=['PUT'])
+@api.route('/rows/<int:row_id>', methods=['PUT'])
 def update_row(row_id):
     """Update a row"""
     row = Row.query.get_or_404(row_id)
@@ -432,6 +604,11 @@ def update_row(row_id):
     script_changed = 'script' in data and data.get('script') != row.script
     script_result_changed = 'scriptResult' in data and data.get('scriptResult') != row.script_result
     
+    # A PUT that repeats the current values (e.g. an autosave) writes, logs and broadcasts nothing
+    if (old_status == new_status and not role_changed and not time_changed and not duration_changed and
+            not description_changed and not script_changed and not script_result_changed):
+        return make_json_response(row.to_dict(), 200)
+    
     # Preserve updated_at if only status is being changed (to maintain row order)
     only_status_changed = (
         not role_changed and 
@@ -479,12 +656,11 @@ def update_row(row_id):
             if socketio:
                 socketio.emit('phases_updated', {'project_id': project.id}, room=f'project_{project.id}')
             
-            return jsonify(row.to_dict()), 200
+            return make_json_response(row.to_dict(), 200)
         except Exception as e:
             db.session.rollback()
             # Fall back to normal update if raw SQL fails
             row.status = new_status
-            row.updated_at = datetime.utcnow()
             db.session.commit()
             if old_status != new_status:
                 user_name = data.get('user_name', 'Unknown')
@@ -498,7 +674,7 @@ def update_row(row_id):
             if socketio:
                 socketio.emit('phases_updated', {'project_id': project.id}, room=f'project_{project.id}')
             
-            return jsonify(row.to_dict()), 200
+            return make_json_response(row.to_dict(), 200)
     else:
         # Normal update - let ON UPDATE CURRENT_TIMESTAMP work
         row.role = data.get('role', row.role)
@@ -508,7 +684,6 @@ def update_row(row_id):
         row.script = data.get('script', row.script)
         row.status = new_status
         row.script_result = data.get('scriptResult', row.script_result)
-        row.updated_at = datetime.utcnow()
         db.session.commit()
         
         # Log row edit if any non-status field changed (only if user is manager)
@@ -542,10 +717,10 @@ def update_row(row_id):
     if socketio:
         socketio.emit('phases_updated', {'project_id': project.id}, room=f'project_{project.id}')
     
-    return jsonify(row.to_dict()), 200
+    return make_json_response(row.to_dict(), 200)
 
 
-@api.route('/api/rows/<int:row_id>', methods=['DELETE'])
+@api.route('/rows/<int:row_id>', methods=['DELETE'])
 def delete_row(row_id):
     """Delete a row"""
     row = Row.query.get_or_404(row_id)
@@ -580,59 +755,63 @@ def delete_row(row_id):
     
     db.session.delete(row)
     db.session.commit()
-    return jsonify({'message': 'Row deleted'}), 200
+    return make_json_response({'message': 'Row deleted'}, 200)
 
 
-@api.route('/api/rows/<int:row_id>/run-script', methods=['POST'])
+@api.route('/rows/<int:row_id>/run-script', methods=['POST'])
 def run_script(row_id):
     """Run a script for a row"""
-    row = Row.query.get_or_404(row_id)
+    # Everything the endpoint needs from the row and its project, in one query
+    target = db.session.execute(
+        select(Row.script, Project.id, Project.reset_epoch)
+        .join(Phase, Phase.id == Row.phase_id)
+        .join(Project, Project.id == Phase.project_id)
+        .where(Row.id == row_id)
+    ).first()
+    if target is None:
+        abort(404)
+    script, project_id, reset_epoch = target
     data = request.get_json() or {}
     
     # TODO: Implement actual script execution
     # For now, simulate with random result
-    import random
-    result = random.choice([True, False])
+    result = bool(random.getrandbits(1))
     
-    # Preserve updated_at to maintain row order (only script_result changes)
-    # Use raw SQL to update only script_result without triggering ON UPDATE CURRENT_TIMESTAMP
+    # Only script_result changes; assigning updated_at to itself keeps the row order
+    # and stops MySQL's ON UPDATE CURRENT_TIMESTAMP from bumping it
     # Note: 'rows' is a MySQL reserved word, so we must escape it with backticks
-    original_updated_at = row.updated_at
-    original_updated_at_str = original_updated_at.strftime('%Y-%m-%d %H:%M:%S')
-    
-    # Use raw SQL to preserve updated_at
     db.session.execute(
-        text("UPDATE `rows` SET script_result = :result, updated_at = :updated_at WHERE id = :row_id"),
-        {'result': result, 'updated_at': original_updated_at_str, 'row_id': row_id}
+        text("UPDATE `rows` SET script_result = :result, updated_at = updated_at WHERE id = :row_id"),
+        {'result': result, 'row_id': row_id}
     )
     db.session.commit()
     
-    # Refresh the row object
-    db.session.refresh(row)
-    
     # Log script execution
     user_name = data.get('user_name', 'Unknown')
     user_role = data.get('user_role', 'Unknown')
-    project = row.phase.project
-    script_path = row.script or 'N/A'
-    ActionLogger.log_script_execution(project.id, user_name, user_role, row_id, script_path, result, project.reset_epoch)
+    script_path = script or 'N/A'
+    ActionLogger.log_script_execution(project_id, user_name, user_role, row_id, script_path, result, reset_epoch)
     
-    return jsonify({'result': result}), 200
+    return make_json_response({'result': result}, 200)
 
 
 # ==================== PERIODIC SCRIPT ENDPOINTS ====================
 
-@api.route('/api/projects/<int:project_id>/periodic-scripts', methods=['GET'])
+@api.route('/projects/<int:project_id>/periodic-scripts', methods=['GET'])
 def get_periodic_scripts(project_id):
     """Get all periodic scripts for a project"""
-    scripts = PeriodicScript.query.filter_by(project_id=project_id).all()
-    return jsonify([script.to_dict() for script in scripts]), 200
+    # orjson writes last_executed in the same ISO format as PeriodicScript.to_dict()
+    scripts = db.session.execute(
+        select(PeriodicScript.id, PeriodicScript.name, PeriodicScript.path, PeriodicScript.status, PeriodicScript.last_executed)
+        .where(PeriodicScript.project_id == project_id)
+    ).mappings()
+    return make_cached_json_response([dict(script) for script in scripts])
 
 
-@api.route('/api/projects/<int:project_id>/periodic-scripts', methods=['POST'])
+@api.route('/projects/<int:project_id>/periodic-scripts', methods=['POST'])
 def create_periodic_script(project_id):
     """Create a new periodic script"""
-    project = Project.query.get_or_404(project_id)
+    project = _get_project_or_404(project_id)
     data = request.get_json()
     
     script = PeriodicScript(
@@ -650,37 +829,41 @@ def create_periodic_script(project_id):
     if project.manager_role == user_role:
         ActionLogger.log_script_add(project.id, user_name, user_role, script.id, script.name, project.reset_epoch)
     
-    return jsonify(script.to_dict()), 201
+    return make_json_response(script.to_dict(), 201)
 
 
-@api.route('/api/periodic-scripts/<int:script_id>', methods=['PUT'])
+@api.route('/periodic-scripts/<int:script_id>', methods=['PUT'])
 def update_periodic_script(script_id):
     """Update a periodic script"""
     script = PeriodicScript.query.get_or_404(script_id)
     data = request.get_json()
     
+    # Nothing to write (or log) when the PUT repeats the current values
+    if (data.get('name', script.name) == script.name and data.get('path', script.path) == script.path and
+            data.get('status', script.status) == script.status):
+        return make_json_response(script.to_dict(), 200)
+    
     script.name = data.get('name', script.name)
     script.path = data.get('path', script.path)
     script.status = data.get('status', script.status)
-    script.updated_at = datetime.utcnow()
     
     db.session.commit()
     
     # Log script update (only if user is manager)
-    project = Project.query.get(script.project_id)
+    project = _get_project(script.project_id)
     user_name = data.get('user_name', 'Unknown')
     user_role = data.get('user_role', 'Unknown')
     if project and project.manager_role == user_role:
         ActionLogger.log_script_update(project.id, user_name, user_role, script_id, script.name, project.reset_epoch)
     
-    return jsonify(script.to_dict()), 200
+    return make_json_response(script.to_dict(), 200)
 
 
-@api.route('/api/periodic-scripts/<int:script_id>', methods=['DELETE'])
+@api.route('/periodic-scripts/<int:script_id>', methods=['DELETE'])
 def delete_periodic_script(script_id):
     """Delete a periodic script"""
     script = PeriodicScript.query.get_or_404(script_id)
-    project = Project.query.get(script.project_id)
+    project = _get_project(script.project_id)
     script_name = script.name
     
     # Log script deletion (only if user is manager)
@@ -692,29 +875,29 @@ def delete_periodic_script(script_id):
     
     db.session.delete(script)
     db.session.commit()
-    return jsonify({'message': 'Script deleted'}), 200
+    return make_json_response({'message': 'Script deleted'}, 200)
 
 
 # ==================== RELATED DOCUMENTS ENDPOINTS ====================
 
-@api.route('/api/projects/<int:project_id>/related-documents', methods=['GET'])
+@api.route('/projects/<int:project_id>/related-documents', methods=['GET'])
 def get_related_documents(project_id):
     """Get all related documents for a project"""
-    project = Project.query.get_or_404(project_id)
+    _project_exists_or_404(project_id)
     documents = RelatedDocument.query.filter_by(project_id=project_id).order_by(RelatedDocument.order_index, RelatedDocument.id).all()
-    return jsonify([doc.to_dict() for doc in documents]), 200
+    return make_cached_json_response([doc.to_dict() for doc in documents])
 
 
-@api.route('/api/projects/<int:project_id>/related-documents', methods=['POST'])
+@api.route('/projects/<int:project_id>/related-documents', methods=['POST'])
 def create_related_document(project_id):
     """Create a new related document (manager only)"""
-    project = Project.query.get_or_404(project_id)
+    project = _get_project_or_404(project_id)
     data = request.get_json()
     
     # Check if user is manager
     user_role = data.get('user_role', '')
     if project.manager_role != user_role:
-        return jsonify({'error': 'Only managers can create related documents'}), 403
+        return make_json_response({'error': 'Only managers can create related documents'}, 403)
     
     name = data.get('name', '').strip()
     url = data.get('url', '').strip()
@@ -722,9 +905,9 @@ def create_related_document(project_id):
     order_index = data.get('order_index', 0)
     
     if not name:
-        return jsonify({'error': 'Name is required'}), 400
+        return make_json_response({'error': 'Name is required'}, 400)
     if not url:
-        return jsonify({'error': 'URL is required'}), 400
+        return make_json_response({'error': 'URL is required'}, 400)
     
     # Get max order_index if not provided
     if order_index == 0:
@@ -741,20 +924,20 @@ def create_related_document(project_id):
     db.session.add(document)
     db.session.commit()
     
-    return jsonify(document.to_dict()), 201
+    return make_json_response(document.to_dict(), 201)
 
 
-@api.route('/api/related-documents/<int:doc_id>', methods=['PUT'])
+@api.route('/related-documents/<int:doc_id>', methods=['PUT'])
 def update_related_document(doc_id):
     """Update a related document (manager only)"""
     document = RelatedDocument.query.get_or_404(doc_id)
-    project = Project.query.get(document.project_id)
+    project = _get_project(document.project_id)
     data = request.get_json()
     
     # Check if user is manager
     user_role = data.get('user_role', '')
     if project.manager_role != user_role:
-        return jsonify({'error': 'Only managers can update related documents'}), 403
+        return make_json_response({'error': 'Only managers can update related documents'}, 403)
     
     if 'name' in data:
         document.name = data['name'].strip()
@@ -765,30 +948,29 @@ def update_related_document(doc_id):
     if 'order_index' in data:
         document.order_index = int(data['order_index'])
     
-    document.updated_at = datetime.utcnow()
     db.session.commit()
     
-    return jsonify(document.to_dict()), 200
+    return make_json_response(document.to_dict(), 200)
 
 
-@api.route('/api/related-documents/<int:doc_id>', methods=['DELETE'])
+@api.route('/related-documents/<int:doc_id>', methods=['DELETE'])
 def delete_related_document(doc_id):
     """Delete a related document (manager only)"""
     document = RelatedDocument.query.get_or_404(doc_id)
-    project = Project.query.get(document.project_id)
+    project = _get_project(document.project_id)
     data = request.get_json() or {}
     
     # Check if user is manager
     user_role = data.get('user_role', '')
     if project.manager_role != user_role:
-        return jsonify({'error': 'Only managers can delete related documents'}), 403
+        return make_json_response({'error': 'Only managers can delete related documents'}, 403)
     
     db.session.delete(document)
     db.session.commit()
-    return jsonify({'message': 'Document deleted'}), 200
+    return make_json_response({'message': 'Document deleted'}, 200)
 
 
-@api.route('/api/files/<path:file_path>', methods=['GET'])
+@api.route('/files/<path:file_path>', methods=['GET'])
 def serve_file(file_path):
     """Serve local files securely with path validation"""
     # Normalize the path to prevent directory traversal
@@ -797,7 +979,7 @@ def serve_file(file_path):
     
     # Prevent directory traversal attacks
     if '..' in normalized_path or normalized_path.startswith('/'):
-        return jsonify({'error': 'Invalid file path'}), 400
+        return make_json_response({'error': 'Invalid file path'}, 400)
     
     # Get the base directory for files (can be configured in config.py)
     # Default to a 'files' directory in the backend folder
@@ -815,11 +997,11 @@ def serve_file(file_path):
     real_file = os.path.realpath(full_path)
     
     if not real_file.startswith(real_base):
-        return jsonify({'error': 'Access denied'}), 403
+        return make_json_response({'error': 'Access denied'}, 403)
     
     # Check if file exists
     if not os.path.exists(real_file) or not os.path.isfile(real_file):
-        return jsonify({'error': 'File not found'}), 404
+        return make_json_response({'error': 'File not found'}, 404)
     
     # Determine MIME type based on file extension
     _, ext = os.path.splitext(real_file)
@@ -843,7 +1025,7 @@ def serve_file(file_path):
     return send_file(real_file, mimetype=mimetype)
 
 
-@api.route('/api/periodic-scripts/<int:script_id>/execute', methods=['POST'])
+@api.route('/periodic-scripts/<int:script_id>/execute', methods=['POST'])
 def execute_periodic_script(script_id):
     """Execute a periodic script and update status"""
     script = PeriodicScript.query.get_or_404(script_id)
@@ -871,70 +1053,69 @@ def execute_periodic_script(script_id):
         
         # Update script status and last_executed timestamp
         script.status = bool(status)
-        script.last_executed = datetime.utcnow()
-        script.updated_at = datetime.utcnow()
+        script.last_executed = func.now()
         db.session.commit()
         
         # Return result with status and interval, plus updated script
-        return jsonify({
+        return make_json_response({
             'result': {
                 'status': status,
                 'interval': interval
             },
             'script': script.to_dict()
-        }), 200
+        }, 200)
         
     except requests.exceptions.RequestException as e:
         # If script execution fails, log error and return error response
         current_app.logger.error(f'Failed to execute periodic script {script_id} at {script.path}: {str(e)}')
-        return jsonify({
+        return make_json_response({
             'error': f'Failed to execute script: {str(e)}',
             'result': {
                 'status': False,
                 'interval': 60  # Default interval on error
             },
             'script': script.to_dict()
-        }), 500
+        }, 500)
     except (ValueError, KeyError) as e:
         # If response parsing fails, log error and return error response
         current_app.logger.error(f'Failed to parse periodic script {script_id} response: {str(e)}')
-        return jsonify({
+        return make_json_response({
             'error': f'Invalid script response format: {str(e)}',
             'result': {
                 'status': False,
                 'interval': 60  # Default interval on error
             },
             'script': script.to_dict()
-        }), 500
+        }, 500)
 
 
 # ==================== ROLE ENDPOINTS ====================
 
-@api.route('/api/projects/<int:project_id>/roles', methods=['GET'])
+@api.route('/projects/<int:project_id>/roles', methods=['GET'])
 def get_project_roles(project_id):
     """Get all roles for a project"""
-    roles = ProjectRole.query.filter_by(project_id=project_id).all()
-    return jsonify([role.role_name for role in roles]), 200
+    role_names = db.session.scalars(select(ProjectRole.role_name).where(ProjectRole.project_id == project_id)).all()
+    return make_cached_json_response(role_names)
 
 
-@api.route('/api/projects/<int:project_id>/roles', methods=['POST'])
+@api.route('/projects/<int:project_id>/roles', methods=['POST'])
 def add_project_role(project_id):
     """Add a new role to a project"""
-    project = Project.query.get_or_404(project_id)
+    project = _get_project_or_404(project_id)
     data = request.get_json()
     role_name = data.get('role')
     
     if not role_name:
-        return jsonify({'error': 'Role name required'}), 400
-    
-    # Check if role already exists
-    existing = ProjectRole.query.filter_by(project_id=project_id, role_name=role_name).first()
-    if existing:
-        return jsonify({'error': 'Role already exists'}), 400
+        return make_json_response({'error': 'Role name required'}, 400)
     
+    # The unique_project_role constraint rejects duplicates, no need to look first
     project_role = ProjectRole(project_id=project_id, role_name=role_name)
     db.session.add(project_role)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return make_json_response({'error': 'Role already exists'}, 400)
     
     # Log role addition (only if user is manager)
     user_name = data.get('user_name', 'Unknown')
@@ -942,15 +1123,15 @@ def add_project_role(project_id):
     if project.manager_role == user_role:
         ActionLogger.log_role_add(project.id, user_name, user_role, role_name, project.reset_epoch)
     
-    return jsonify(project_role.to_dict()), 201
+    return make_json_response(project_role.to_dict(), 201)
 
 
 # ==================== BULK UPDATE ENDPOINTS ====================
 
-@api.route('/api/projects/<int:project_id>/table-data', methods=['PUT'])
+@api.route('/projects/<int:project_id>/table-data', methods=['PUT'])
 def update_table_data(project_id):
     """Bulk update table data (phases and rows)"""
-    project = Project.query.get_or_404(project_id)
+    project = _get_project_or_404(project_id)
     request_data = request.get_json()  # Can be array (legacy) or dict with phases, user_name, user_role
     
     # Extract user info from request JSON if it's a dict wrapper, otherwise use defaults
@@ -966,15 +1147,17 @@ def update_table_data(project_id):
         user_role = project.manager_role
     else:
         # Invalid format
-        return jsonify({'error': 'Invalid request format'}), 400
+        return make_json_response({'error': 'Invalid request format'}, 400)
     
     should_log = True  # Always log bulk updates since only managers can perform them
     
     try:
-        # Get old data before deletion for comparison
+        # Load current phases and rows; they are diffed against the payload below.
+        # The phases are locked until commit so no other request adds rows to them
+        # meanwhile, which _insert_rows relies on to read the new row ids back
+        old_phases = Phase.query.options(selectinload(Phase.rows)).filter_by(project_id=project_id).order_by(Phase.phase_number).with_for_update().all()
         old_phases_data = {}
         if should_log:
-            old_phases = Phase.query.options(joinedload(Phase.rows)).filter_by(project_id=project_id).order_by(Phase.phase_number).all()
             for old_phase in old_phases:
                 old_phases_data[old_phase.phase_number] = {
                     'phase_id': old_phase.id,
@@ -997,14 +1180,15 @@ def update_table_data(project_id):
             phase_num = phase_data['phase']
             rows_list = []
             for idx, row_data in enumerate(phase_data.get('rows', [])):
+                get = row_data.get
                 rows_list.append({
-                    'id': row_data.get('id'),  # Include row ID to detect moves
-                    'role': row_data.get('role', ''),
-                    'time': row_data.get('time', '00:00:00'),
-                    'duration': row_data.get('duration', '00:00'),
-                    'description': row_data.get('description', ''),
-                    'script': row_data.get('script', ''),
-                    'status': row_data.get('status', 'N/A'),
+                    'id': get('id'),  # Include row ID to detect moves
+                    'role': get('role', ''),
+                    'time': get('time', '00:00:00'),
+                    'duration': get('duration', '00:00'),
+                    'description': get('description', ''),
+                    'script': get('script', ''),
+                    'status': get('status', 'N/A'),
                     'index': idx
                 })
             new_phases_data[phase_num] = {
@@ -1019,41 +1203,104 @@ def update_table_data(project_id):
                 old_phase_data = old_phases_data[phase_num]
                 ActionLogger.log_phase_delete(project.id, user_name, user_role, old_phase_data['phase_id'], phase_num, project.reset_epoch)
         
-        # Clear existing phases and rows
-        Phase.query.filter_by(project_id=project_id).delete()
+        # Apply the payload as a diff: existing rows are matched by id and updated in place,
+        # only new rows are inserted and only missing rows/phases are deleted
+        existing_phases = {phase.phase_number: phase for phase in old_phases}
+        existing_rows = {row.id: row for phase in old_phases for row in phase.rows}
         
-        # Track created phases and rows for logging
-        created_phases = {}
+        # Track created rows for logging
         created_rows = {}
         
-        # Recreate phases and rows
+        # Create missing phases in one batch
+        phase_ids = {}
+        new_phases = {}
         for phase_data in data:
             phase_num = phase_data['phase']
-            phase = Phase(
-                project_id=project_id,
-                phase_number=phase_num,
-                is_active=phase_data.get('is_active', False)
+            is_active = phase_data.get('is_active', False)
+            phase = existing_phases.get(phase_num)
+            if phase is None:
+                new_phases[phase_num] = {'project_id': project_id, 'phase_number': phase_num, 'is_active': is_active}
+            else:
+                if phase.is_active != is_active:
+                    phase.is_active = is_active
+                phase_ids[phase_num] = phase.id
+        created_phases = _insert_phases(project_id, list(new_phases.values()))  # {phase_num: id}, for logging
+        phase_ids.update(created_phases)
+        
+        # Rows are listed by (updated_at, id), so updated_at is written explicitly:
+        # unchanged order keeps the stored values, otherwise the phase is renumbered
+        base_time = datetime.utcnow()
+        claimed_row_ids = set()
+        row_updates = []
+        row_mappings = []
+        row_positions = []
+        for phase_data in data:
+            phase_num = phase_data['phase']
+            phase_id = phase_ids[phase_num]
+            rows_data = phase_data.get('rows', [])
+            
+            # Resolve which payload rows are existing rows (each id can be claimed once)
+            matched = []
+            for row_data in rows_data:
+                row = existing_rows.get(row_data.get('id'))
+                if row is not None and row.id not in claimed_row_ids:
+                    claimed_row_ids.add(row.id)
+                    matched.append(row)
+                else:
+                    matched.append(None)
+            
+            # Order is kept when the existing rows stay in their stored order and new rows only follow them
+            kept = [row for row in matched if row is not None]
+            old_order = existing_phases[phase_num].rows if phase_num in existing_phases else []
+            kept_ids = {row.id for row in kept}
+            first_new = next((idx for idx, row in enumerate(matched) if row is None), len(matched))
+            keep_order = (
+                all(row is None for row in matched[first_new:]) and
+                [row.id for row in kept] == [row.id for row in old_order if row.id in kept_ids]
             )
-            db.session.add(phase)
-            db.session.flush()  # Get phase.id
-            created_phases[phase_num] = phase
+            append_time = max([base_time] + [row.updated_at for row in kept if row.updated_at])
             
-            for idx, row_data in enumerate(phase_data.get('rows', [])):
-                row = Row(
-                    phase_id=phase.id,
-                    role=row_data.get('role', ''),
-                    time=row_data.get('time', '00:00:00'),
-                    duration=row_data.get('duration', '00:00'),
-                    description=row_data.get('description', ''),
-                    script=row_data.get('script', ''),
-                    status=row_data.get('status', 'N/A'),
-                    script_result=row_data.get('scriptResult')
-                )
-                db.session.add(row)
-                db.session.flush()  # Get row.id
-                if phase_num not in created_rows:
-                    created_rows[phase_num] = []
-                created_rows[phase_num].append((row.id, idx))
+            for idx, (row_data, row) in enumerate(zip(rows_data, matched)):
+                get = row_data.get
+                values = {
+                    'phase_id': phase_id,
+                    'role': get('role', ''),
+                    'time': get('time', '00:00:00'),
+                    'duration': get('duration', '00:00'),
+                    'description': get('description', ''),
+                    'script': get('script', ''),
+                    'status': get('status', 'N/A'),
+                    'script_result': get('scriptResult')
+                }
+                if row is None:
+                    values['updated_at'] = append_time if keep_order else base_time + timedelta(seconds=idx)
+                    row_mappings.append(values)
+                    row_positions.append((phase_num, idx))
+                    continue
+                
+                values['updated_at'] = row.updated_at if keep_order else base_time + timedelta(seconds=idx)
+                if any(getattr(row, key) != value for key, value in values.items()):
+                    values['id'] = row.id
+                    row_updates.append(values)
+                created_rows.setdefault(phase_num, []).append((row.id, idx))
+        
+        # Write everything without autoflush; the is_active changes above are flushed once by commit
+        with db.session.no_autoflush:
+            _update_rows(row_updates)
+            _insert_rows(row_mappings, existing_rows)  # Fills in 'id'
+            for mapping, (phase_num, idx) in zip(row_mappings, row_positions):
+                created_rows.setdefault(phase_num, []).append((mapping['id'], idx))
+            for phase_rows in created_rows.values():
+                phase_rows.sort(key=lambda item: item[1])
+        
+            # Rows that are no longer in the payload, then phases that are gone
+            # (their remaining rows were either moved above or are deleted here)
+            deleted_row_ids = [row_id for row_id in existing_rows if row_id not in claimed_row_ids]
+            if deleted_row_ids:
+                Row.query.filter(Row.id.in_(deleted_row_ids)).delete(synchronize_session=False)
+            deleted_phase_ids = [phase.id for phase_num, phase in existing_phases.items() if phase_num not in phase_ids]
+            if deleted_phase_ids:
+                Phase.query.filter(Phase.id.in_(deleted_phase_ids)).delete(synchronize_session=False)
         
         db.session.commit()
         
@@ -1061,8 +1308,7 @@ def update_table_data(project_id):
         if should_log:
             added_phases = set(new_phases_data.keys()) - set(old_phases_data.keys())
             for phase_num in added_phases:
-                phase = created_phases[phase_num]
-                ActionLogger.log_phase_add(project.id, user_name, user_role, phase.id, phase_num, project.reset_epoch)
+                ActionLogger.log_phase_add(project.id, user_name, user_role, created_phases[phase_num], phase_num, project.reset_epoch)
         
         # Compare and log row changes
         if should_log:
@@ -1530,16 +1776,16 @@ def update_table_data(project_id):
         if socketio:
             socketio.emit('phases_updated', {'project_id': project_id}, room=f'project_{project_id}')
         
-        return jsonify({'message': 'Table data updated'}), 200
+        return make_json_response({'message': 'Table data updated'}, 200)
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        return make_json_response({'error': str(e)}, 500)
 
 
-@api.route('/api/projects/<int:project_id>/periodic-scripts/bulk', methods=['PUT'])
+@api.route('/projects/<int:project_id>/periodic-scripts/bulk', methods=['PUT'])
 def update_periodic_scripts_bulk(project_id):
     """Bulk update periodic scripts"""
-    project = Project.query.get_or_404(project_id)
+    project = _get_project_or_404(project_id)
     request_data = request.get_json() or {}
     
     # Extract user info if provided, otherwise use defaults
@@ -1582,24 +1828,19 @@ def update_periodic_scripts_bulk(project_id):
                 old_script = old_scripts_by_key[key]
                 ActionLogger.log_script_delete(project.id, user_name, user_role, old_script['id'], old_script['name'], project.reset_epoch)
         
-        # Clear existing scripts
-        PeriodicScript.query.filter_by(project_id=project_id).delete()
+        # Recreate scripts in one batch instead of flushing each one for its id
+        scripts = [PeriodicScript(
+            project_id=project_id,
+            name=script_data.get('name', ''),
+            path=script_data.get('path', ''),
+            status=script_data.get('status', False)
+        ) for script_data in data]
+        with db.session.no_autoflush:
+            PeriodicScript.query.filter_by(project_id=project_id).delete()
+            db.session.bulk_save_objects(scripts, return_defaults=True)  # Fills in script.id
         
         # Track created scripts for logging (indexed by name+path)
-        created_scripts_by_key = {}
-        
-        # Recreate scripts
-        for script_data in data:
-            script = PeriodicScript(
-                project_id=project_id,
-                name=script_data.get('name', ''),
-                path=script_data.get('path', ''),
-                status=script_data.get('status', False)
-            )
-            db.session.add(script)
-            db.session.flush()  # Get script.id
-            key = (script.name, script.path)
-            created_scripts_by_key[key] = script
+        created_scripts_by_key = {(script.name, script.path): script for script in scripts}
         
         db.session.commit()
         
@@ -1623,19 +1864,17 @@ def update_periodic_scripts_bulk(project_id):
                     script = created_scripts_by_key[key]
                     ActionLogger.log_script_update(project.id, user_name, user_role, script.id, script.name, project.reset_epoch)
         
-        return jsonify({'message': 'Periodic scripts updated'}), 200
+        return make_json_response({'message': 'Periodic scripts updated'}, 200)
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        return make_json_response({'error': str(e)}, 500)
 
 
 # ==================== USER/LOGIN ENDPOINTS ====================
 
-@api.route('/api/projects/<int:project_id>/active-logins', methods=['GET'])
+@api.route('/projects/<int:project_id>/active-logins', methods=['GET'])
 def get_active_logins(project_id):
     """Get all active logins for a project, auto-deactivating stale sessions"""
-    from datetime import timedelta
-    
     # Auto-deactivate users who haven't sent a heartbeat in 2+ hours
     stale_threshold = datetime.utcnow() - timedelta(hours=2)
     stale_users = User.query.filter(
@@ -1666,45 +1905,51 @@ def get_active_logins(project_id):
         db.session.commit()
     
     active_users = User.query.filter_by(project_id=project_id, is_active=True).all()
-    return jsonify([user.to_dict() for user in active_users]), 200
+    return make_cached_json_response([user.to_dict() for user in active_users])
 
 
-@api.route('/api/projects/<int:project_id>/login', methods=['POST'])
+@api.route('/projects/<int:project_id>/login', methods=['POST'])
 def register_login(project_id):
     """Register a user login - marks role as taken. Reactivates inactive users."""
-    project = Project.query.get_or_404(project_id)
     data = request.get_json()
     
     name = (data.get('name') or '').strip()
     role = (data.get('role') or '').strip()
     
     if not name or not role:
-        return jsonify({'error': 'Name and role are required'}), 400
+        return make_json_response({'error': 'Name and role are required'}, 400)
     
-    # Check if role is already taken by an active user
-    existing_active = User.query.filter_by(
-        project_id=project_id, 
-        role=role, 
-        is_active=True
-    ).first()
+    # One lookup for both the active holder of the role and this user's own record;
+    # the name match is evaluated by the database so it follows the column collation
+    existing_active = None
+    user = None
+    for candidate, same_name in db.session.query(User, User.name == name).filter(
+        User.project_id == project_id,
+        User.role == role,
+        or_(User.is_active == True, User.name == name)
+    ):
+        if candidate.is_active and existing_active is None:
+            existing_active = candidate
+        if same_name and user is None:
+            user = candidate
+    
+    # A project with users exists (they are deleted with it); only a first login needs the check
+    if existing_active is None and user is None:
+        _project_exists_or_404(project_id)
     
+    # Check if role is already taken by an active user
     if existing_active:
-        return jsonify({
+        return make_json_response({
             'error': f'Role "{role}" is already in use by {existing_active.name}'
-        }), 409
+        }, 409)
     
     # Create or update user record (reactivates inactive users)
-    user = User.query.filter_by(
-        project_id=project_id,
-        role=role,
-        name=name
-    ).first()
-    
+    now = datetime.utcnow()
     if user:
         # Reactivate existing user (even if they were previously inactive)
         user.is_active = True
-        user.last_login = datetime.utcnow()
-        user.last_seen = datetime.utcnow()
+        user.last_login = now
+        user.last_seen = now
     else:
         # Create new user
         user = User(
@@ -1712,11 +1957,14 @@ def register_login(project_id):
             role=role,
             name=name,
             is_active=True,
-            last_login=datetime.utcnow(),
-            last_seen=datetime.utcnow()
+            last_login=now,
+            last_seen=now
         )
         db.session.add(user)
     
+    # Serialize before commit expires the attributes (which would cost another SELECT)
+    db.session.flush()
+    user_data = user.to_dict()
     db.session.commit()
     
     # Emit Socket.IO event for active logins update
@@ -1724,10 +1972,10 @@ def register_login(project_id):
     if socketio:
         socketio.emit('active_logins_updated', {'project_id': project_id}, room=f'project_{project_id}')
     
-    return jsonify(user.to_dict()), 200
+    return make_json_response(user_data, 200)
 
 
-@api.route('/api/projects/<int:project_id>/logout', methods=['POST'])
+@api.route('/projects/<int:project_id>/logout', methods=['POST'])
 def register_logout(project_id):
     """Register a user logout - frees up the role"""
     # Handle both JSON and FormData (for sendBeacon)
@@ -1741,7 +1989,7 @@ def register_logout(project_id):
         role = (request.form.get('role') or '').strip()
     
     if not name or not role:
-        return jsonify({'error': 'Name and role are required'}), 400
+        return make_json_response({'error': 'Name and role are required'}, 400)
     
     # Find and deactivate the user
     user = User.query.filter_by(
@@ -1760,12 +2008,12 @@ def register_logout(project_id):
         if socketio:
             socketio.emit('active_logins_updated', {'project_id': project_id}, room=f'project_{project_id}')
         
-        return jsonify({'message': 'Logout successful'}), 200
+        return make_json_response({'message': 'Logout successful'}, 200)
     else:
-        return jsonify({'error': 'Active login not found'}), 404
+        return make_json_response({'error': 'Active login not found'}, 404)
 
 
-@api.route('/api/projects/<int:project_id>/heartbeat', methods=['POST'])
+@api.route('/projects/<int:project_id>/heartbeat', methods=['POST'])
 def heartbeat(project_id):
     """Update last_seen timestamp for a user to indicate they're still active"""
     data = request.get_json() or {}
@@ -1773,7 +2021,7 @@ def heartbeat(project_id):
     role = (data.get('role') or '').strip()
     
     if not name or not role:
-        return jsonify({'error': 'Name and role are required'}), 400
+        return make_json_response({'error': 'Name and role are required'}, 400)
     
     user = User.query.filter_by(
         project_id=project_id,
@@ -1785,15 +2033,15 @@ def heartbeat(project_id):
     if user:
         user.last_seen = datetime.utcnow()
         db.session.commit()
-        return jsonify({'message': 'Heartbeat received'}), 200
+        return make_json_response({'message': 'Heartbeat received'}, 200)
     else:
-        return jsonify({'error': 'Active user not found'}), 404
+        return make_json_response({'error': 'Active user not found'}, 404)
 
 
-@api.route('/api/projects/<int:project_id>/user-notification', methods=['POST'])
+@api.route('/projects/<int:project_id>/user-notification', methods=['POST'])
 def create_user_notification(project_id):
     """Create a notification for a specific user (by role)"""
-    project = Project.query.get_or_404(project_id)
+    _project_exists_or_404(project_id)
     data = request.get_json()
     
     target_role = (data.get('targetRole') or '').strip()
@@ -1801,7 +2049,7 @@ def create_user_notification(project_id):
     notification_data = data.get('data', {})
     
     if not target_role:
-        return jsonify({'error': 'Target role is required'}), 400
+        return make_json_response({'error': 'Target role is required'}, 400)
     
     # Find the active user with that role
     user = User.query.filter_by(
@@ -1811,12 +2059,11 @@ def create_user_notification(project_id):
     ).first()
     
     if not user:
-        return jsonify({'error': f'No active user found with role "{target_role}"'}), 404
+        return make_json_response({'error': f'No active user found with role "{target_role}"'}, 404)
     
     # Set notification for that user
-    import json
     user.notification_command = command
-    user.notification_data = json.dumps(notification_data) if notification_data else None
+    user.notification_data = dumps_json_text(notification_data) if notification_data else None
     user.notification_timestamp = datetime.utcnow()
     db.session.commit()
     
@@ -1830,44 +2077,47 @@ def create_user_notification(project_id):
             'data': notification_data
         }, room=user_room)
     
-    return jsonify(user.to_dict()), 200
+    return make_json_response(user.to_dict(), 200)
 
 
-@api.route('/api/projects/<int:project_id>/user-notification', methods=['GET'])
+@api.route('/projects/<int:project_id>/user-notification', methods=['GET'])
 def get_user_notification(project_id):
     """Get notification for the current user (by role and name)"""
-    project = Project.query.get_or_404(project_id)
+    _project_exists_or_404(project_id)
     role = request.args.get('role', '').strip()
     name = request.args.get('name', '').strip()
     
     if not role or not name:
-        return jsonify({'error': 'Role and name are required'}), 400
+        return make_json_response({'error': 'Role and name are required'}, 400)
     
-    user = User.query.filter_by(
+    # Notifications are pushed over Socket.IO; this is the clients' fallback poll,
+    # so read just the notification columns and let unchanged polls end in a 304
+    notification = db.session.execute(select(
+        User.notification_command, User.notification_data, User.notification_timestamp
+    ).filter_by(
         project_id=project_id,
         role=role,
         name=name,
         is_active=True
-    ).first()
+    ).limit(1)).first()
     
-    if not user:
-        return jsonify({
+    if not notification:
+        return make_cached_json_response({
             'command': None,
             'data': None,
             'timestamp': None
-        }), 200
+        })
     
-    notification_command = user.notification_command
-    notification_data = json.loads(user.notification_data) if user.notification_data else None
+    notification_command, notification_data, notification_timestamp = notification
     
-    return jsonify({
+    return make_cached_json_response({
         'command': notification_command,
-        'data': notification_data,
-        'timestamp': user.notification_timestamp.isoformat() if user.notification_timestamp else None
-    }), 200
+        'data': orjson.Fragment(notification_data) if notification_data else None,
+        'timestamp': notification_timestamp.isoformat() if notification_timestamp else None
+    })
 
 
-@api.route('/api/projects/<int:project_id>/user-notification/clear', methods=['POST'])
+@api.route('/projects/<int:project_id>/user-notification/clear', methods=['POST'])
 def clear_user_notification(project_id):
     """Clear notification for the current user"""
     data = request.get_json()
@@ -1875,7 +2125,7 @@ def clear_user_notification(project_id):
     name = (data.get('name') or '').strip()
     
     if not role or not name:
-        return jsonify({'error': 'Role and name are required'}), 400
+        return make_json_response({'error': 'Role and name are required'}, 400)
     
     user = User.query.filter_by(
         project_id=project_id,
@@ -1889,14 +2139,14 @@ def clear_user_notification(project_id):
         user.notification_data = None
         user.notification_timestamp = None
         db.session.commit()
-        return jsonify({'message': 'Notification cleared'}), 200
+        return make_json_response({'message': 'Notification cleared'}, 200)
     else:
-        return jsonify({'error': 'Active user not found'}), 404
+        return make_json_response({'error': 'Active user not found'}, 404)
 
 
 # ==================== PENDING CHANGES ENDPOINTS ====================
 
-@api.route('/api/projects/<int:project_id>/pending-changes', methods=['POST'])
+@api.route('/projects/<int:project_id>/pending-changes', methods=['POST'])
 def create_pending_change(project_id):
     """Create pending change requests from a non-manager user - creates individual records for each change"""
     project = Project.query.get_or_404(project_id)
@@ -1907,7 +2157,7 @@ def create_pending_change(project_id):
     changes_data = data.get('changes_data', {})
     
     if not submitted_by or not submitted_by_role:
-        return jsonify({'error': 'submitted_by and submitted_by_role are required'}), 400
+        return make_json_response({'error': 'submitted_by and submitted_by_role are required'}, 400)
     
     # Generate a unique submission_id (using UUID)
     submission_id = str(uuid.uuid4())
@@ -1929,7 +2179,7 @@ def create_pending_change(project_id):
         current_version = project.version
         current_phases = Phase.query.filter_by(project_id=project_id).all()
         current_phases_dict = {p.phase_number: p for p in current_phases}
-        current_roles = [pr.role_name for pr in ProjectRole.query.filter_by(project_id=project_id).all()]
+        current_roles_set = set(db.session.scalars(select(ProjectRole.role_name).where(ProjectRole.project_id == project_id)))
         current_scripts = PeriodicScript.query.filter_by(project_id=project_id).all()
         current_scripts_dict = {s.id: s for s in current_scripts}
         
@@ -1941,10 +2191,10 @@ def create_pending_change(project_id):
         submitted_by=submitted_by,
         submitted_by_role=submitted_by_role,
                 change_type='version',
-                changes_data=json.dumps({
+                changes_data={
                     'old_version': current_version,
                     'new_version': changes_data['version']
-                }),
+                },
         status='pending'
     )
             db.session.add(version_change)
@@ -1976,13 +2226,13 @@ def create_pending_change(project_id):
                         submitted_by=submitted_by,
                         submitted_by_role=submitted_by_role,
                         change_type='row_move',
-                        changes_data=json.dumps({
+                        changes_data={
                             'row_id': row_id,
                             'source_phase_number': source_phase_number,
                             'target_phase_number': target_phase_number,
                             'target_position': target_position,
                             'source_row_index': source_row_index  # Store source position
-                        }),
+                        },
                         status='pending'
                     )
                     db.session.add(row_move)
@@ -2007,12 +2257,12 @@ def create_pending_change(project_id):
                         submitted_by=submitted_by,
                         submitted_by_role=submitted_by_role,
                         change_type='row_duplicate',
-                        changes_data=json.dumps({
+                        changes_data={
                             'source_row_id': source_row_id,
                             'new_row_id': new_row_id,  # Store temporary ID so we can update it later
                             'target_phase_number': target_phase_number,
                             'target_position': target_position
-                        }),
+                        },
                         status='pending'
                     )
                     db.session.add(row_duplicate)
@@ -2023,10 +2273,11 @@ def create_pending_change(project_id):
         if 'table_data' in changes_data:
             table_data = changes_data['table_data']
             
-            # Build maps of current rows by phase
-            current_rows_by_phase = {}
-            for phase in current_phases:
-                current_rows_by_phase[phase.phase_number] = {r.id: r for r in Row.query.filter_by(phase_id=phase.id).all()}
+            # Build maps of current rows by phase, loading every row of the project in one query
+            current_rows_by_phase = {phase.phase_number: {} for phase in current_phases}
+            phase_number_by_id = {phase.id: phase.phase_number for phase in current_phases}
+            for row in Row.query.filter(Row.phase_id.in_(phase_number_by_id)):
+                current_rows_by_phase[phase_number_by_id[row.phase_id]][row.id] = row
             
             # Process each phase in the new data
             for phase_data in table_data:
@@ -2059,7 +2310,7 @@ def create_pending_change(project_id):
                             submitted_by=submitted_by,
                             submitted_by_role=submitted_by_role,
                             change_type='row_add',
-                            changes_data=json.dumps({
+                            changes_data={
                                 'phase_number': phase_number,
                                 'phase_id': phase_id,
                                 'row_data': {
@@ -2070,7 +2321,7 @@ def create_pending_change(project_id):
                                     'script': new_row.get('script', ''),
                                     'status': new_row.get('status', 'N/A')
                                 }
-                            }),
+                            },
                             status='pending'
                         )
                         db.session.add(row_add)
@@ -2108,7 +2359,7 @@ def create_pending_change(project_id):
                                 submitted_by=submitted_by,
                                 submitted_by_role=submitted_by_role,
                                 change_type='row_update',
-                                changes_data=json.dumps({
+                                changes_data={
                                     'row_id': row_id,
                                     'old_data': {
                                         'role': current_row.role,
@@ -2126,7 +2377,7 @@ def create_pending_change(project_id):
                                         'script': new_row.get('script', ''),
                                         'status': new_row.get('status', current_row.status)
                                     }
-                                }),
+                                },
                                 status='pending'
                             )
                             db.session.add(row_update)
@@ -2147,7 +2398,7 @@ def create_pending_change(project_id):
                         submitted_by=submitted_by,
                         submitted_by_role=submitted_by_role,
                         change_type='row_delete',
-                        changes_data=json.dumps({
+                        changes_data={
                             'row_id': row_id,
                             'row_data': {
                                 'role': current_row.role,
@@ -2157,7 +2408,7 @@ def create_pending_change(project_id):
                                 'script': current_row.script or '',
                                 'status': current_row.status
                             }
-                        }),
+                        },
                         status='pending'
                     )
                     db.session.add(row_delete)
@@ -2168,7 +2419,6 @@ def create_pending_change(project_id):
         # Note: Roles are typically derived from rows, so we only process explicit role changes
         if 'roles' in changes_data and changes_data['roles'] is not None:
             new_roles = set(changes_data['roles'])
-            current_roles_set = set(current_roles)
             
             # Only process if there are actual differences
             if new_roles != current_roles_set:
@@ -2181,7 +2431,7 @@ def create_pending_change(project_id):
                         submitted_by=submitted_by,
                         submitted_by_role=submitted_by_role,
                         change_type='role_add',
-                        changes_data=json.dumps({'role': role}),
+                        changes_data={'role': role},
                         status='pending'
                     )
                     db.session.add(role_add)
@@ -2196,7 +2446,7 @@ def create_pending_change(project_id):
                         submitted_by=submitted_by,
                         submitted_by_role=submitted_by_role,
                         change_type='role_delete',
-                        changes_data=json.dumps({'role': role}),
+                        changes_data={'role': role},
                         status='pending'
                     )
                     db.session.add(role_delete)
@@ -2211,7 +2461,7 @@ def create_pending_change(project_id):
                 submitted_by=submitted_by,
                 submitted_by_role=submitted_by_role,
                 change_type='table_data',
-                changes_data=json.dumps({'table_data': table_data_for_submission}),
+                changes_data={'table_data': table_data_for_submission},
                 status='pending'
             )
             db.session.add(table_data_change)
@@ -2234,13 +2484,13 @@ def create_pending_change(project_id):
                     submitted_by=submitted_by,
                     submitted_by_role=submitted_by_role,
                     change_type='script_add',
-                    changes_data=json.dumps({
+                    changes_data={
                         'script_data': {
                             'name': new_script.get('name', ''),
                             'path': new_script.get('path', ''),
                             'status': new_script.get('status', False)
                         }
-                    }),
+                    },
                     status='pending'
                 )
                 db.session.add(script_add)
@@ -2263,7 +2513,7 @@ def create_pending_change(project_id):
                         submitted_by=submitted_by,
                         submitted_by_role=submitted_by_role,
                         change_type='script_update',
-                        changes_data=json.dumps({
+                        changes_data={
                             'script_id': script_id,
                             'old_data': {
                                 'name': current_script.name,
@@ -2275,7 +2525,7 @@ def create_pending_change(project_id):
                                 'path': new_script.get('path', current_script.path),
                                 'status': new_script.get('status', current_script.status)
                             }
-                        }),
+                        },
                         status='pending'
                     )
                     db.session.add(script_update)
@@ -2291,22 +2541,21 @@ def create_pending_change(project_id):
                     submitted_by=submitted_by,
                     submitted_by_role=submitted_by_role,
                     change_type='script_delete',
-                    changes_data=json.dumps({
+                    changes_data={
                         'script_id': script_id,
                         'script_data': {
                             'name': current_script.name,
                             'path': current_script.path,
                             'status': current_script.status
                         }
-                    }),
+                    },
                     status='pending'
                 )
                 db.session.add(script_delete)
                 created_changes.append(script_delete)
         
-        db.session.commit()
-        
         # Notify manager if they're logged in and we created changes
+        manager_user = None
         if created_changes and project.manager_role:
             manager_user = User.query.filter_by(
                 project_id=project_id,
@@ -2316,38 +2565,41 @@ def create_pending_change(project_id):
             
             if manager_user:
                 manager_user.notification_command = 'pending_changes'
-                manager_user.notification_data = json.dumps({
+                manager_user.notification_data = dumps_json_text({
                     'submission_id': submission_id,
                     'submitted_by': submitted_by,
                     'submitted_by_role': submitted_by_role,
                     'change_count': len(created_changes)
                 })
                 manager_user.notification_timestamp = datetime.utcnow()
-                db.session.commit()
-                
-                # Emit Socket.IO event for instant notification
-                socketio = get_socketio()
-                if socketio:
-                    socketio.emit('pending_changes_notification', {
-                        'project_id': project_id,
-                        'manager_role': project.manager_role
-                    }, room=f'project_{project_id}')
-        
-        return jsonify({
+        
+        # The changes and the manager's notification are committed together
+        db.session.commit()
+        
+        if manager_user:
+            # Emit Socket.IO event for instant notification
+            socketio = get_socketio()
+            if socketio:
+                socketio.emit('pending_changes_notification', {
+                    'project_id': project_id,
+                    'manager_role': project.manager_role
+                }, room=f'project_{project_id}')
+        
+        return make_json_response({
             'submission_id': submission_id,
             'created_changes': [change.to_dict() for change in created_changes],
             'count': len(created_changes)
-        }), 201
+        }, 201)
         
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        return make_json_response({'error': str(e)}, 500)
 
 
-@api.route('/api/projects/<int:project_id>/pending-changes', methods=['GET'])
+@api.route('/projects/<int:project_id>/pending-changes', methods=['GET'])
 def get_pending_changes(project_id):
     """Get all pending changes for a project"""
-    project = Project.query.get_or_404(project_id)
+    _project_exists_or_404(project_id)
     
     status_filter = request.args.get('status', 'pending')  # 'pending', 'all', 'accepted', 'declined'
     
@@ -2358,446 +2610,421 @@ def get_pending_changes(project_id):
     # Filter out table_data changes - they are internal metadata, not user-visible changes
     query = query.filter(PendingChange.change_type != 'table_data')
     
-    pending_changes = query.order_by(PendingChange.created_at.desc()).all()
-    return jsonify([pc.to_dict() for pc in pending_changes]), 200
-
-
-@api.route('/api/projects/<int:project_id>/pending-changes/<int:change_id>/accept', methods=['POST'])
-def accept_pending_change(project_id, change_id):
-    """Accept an individual pending change and apply it"""
-    project = Project.query.get_or_404(project_id)
-    pending_change = PendingChange.query.filter_by(
-        project_id=project_id,
-        id=change_id,
-        status='pending'
-    ).first_or_404()
-    
-    data = request.get_json()
-    reviewed_by = data.get('reviewed_by', '').strip()
-    
-    try:
-        changes_data = json.loads(pending_change.changes_data)
-        change_type = pending_change.change_type
-        
-        # Apply the change based on type
-        if change_type == 'version':
-            project.version = changes_data['new_version']
-            db.session.commit()
-                
-        elif change_type == 'row_add':
-            phase_number = changes_data.get('phase_number')
-            phase_id = changes_data.get('phase_id')
-            row_data = changes_data.get('row_data', {})
-            
-            # Get or create phase if needed
-            if not phase_id:
-                phase = Phase.query.filter_by(
-                    project_id=project_id,
-                    phase_number=phase_number
-                ).first()
-                if not phase:
-                    phase = Phase(project_id=project_id, phase_number=phase_number, is_active=False)
-                    db.session.add(phase)
-                    db.session.flush()
-                phase_id = phase.id
-                
-            row = Row(
-                phase_id=phase_id,
-                role=row_data.get('role', ''),
-                time=row_data.get('time', '00:00:00'),
-                duration=row_data.get('duration', '00:00'),
-                description=row_data.get('description', ''),
-                script=row_data.get('script', ''),
-                status=row_data.get('status', 'N/A')
-            )
-            db.session.add(row)
-            db.session.commit()
-            
-        elif change_type == 'row_update':
-            row_id = changes_data.get('row_id')
-            new_data = changes_data.get('new_data', {})
-            
-            row = Row.query.get(row_id)
-            if row:
-                # Use raw SQL to preserve updated_at (avoid ON UPDATE CURRENT_TIMESTAMP trigger)
-                original_updated_at = row.updated_at
-                sql = """
-                    UPDATE `rows` 
-                    SET role = :role, time = :time, duration = :duration, 
-                        description = :description, script = :script, status = :status,
-                        updated_at = :updated_at
-                    WHERE id = :row_id
-                """
-                db.session.execute(db.text(sql), {
-                    'role': new_data.get('role', row.role),
-                    'time': new_data.get('time', row.time),
-                    'duration': new_data.get('duration', row.duration),
-                    'description': new_data.get('description', row.description),
-                    'script': new_data.get('script', row.script),
-                    'status': new_data.get('status', row.status),
-                    'updated_at': original_updated_at,
-                    'row_id': row_id
-                })
-                db.session.commit()
-            
-        elif change_type == 'row_delete':
-            row_id = changes_data.get('row_id')
-            row = Row.query.get(row_id)
-            if row:
-                db.session.delete(row)
-                db.session.commit()
-                
-        elif change_type == 'role_add':
-            role_name = changes_data.get('role')
-            # Check if role already exists
-            existing_role = ProjectRole.query.filter_by(
-                project_id=project_id,
-                role_name=role_name
-            ).first()
-            if not existing_role:
-                role = ProjectRole(project_id=project_id, role_name=role_name)
-                db.session.add(role)
-                db.session.commit()
-                
-        elif change_type == 'role_delete':
-            role_name = changes_data.get('role')
-            role = ProjectRole.query.filter_by(
-                project_id=project_id,
-                role_name=role_name
-            ).first()
-            if role:
-                db.session.delete(role)
-                db.session.commit()
-                
-        elif change_type == 'script_add':
-            script_data = changes_data.get('script_data', {})
-            script = PeriodicScript(
-                project_id=project_id,
-                name=script_data.get('name', ''),
-                path=script_data.get('path', ''),
-                status=script_data.get('status', False)
-            )
-            db.session.add(script)
-            db.session.commit()
-            
-        elif change_type == 'script_update':
-            script_id = changes_data.get('script_id')
-            new_data = changes_data.get('new_data', {})
-            
-            script = PeriodicScript.query.get(script_id)
-            if script and script.project_id == project_id:
-                script.name = new_data.get('name', script.name)
-                script.path = new_data.get('path', script.path)
-                script.status = new_data.get('status', script.status)
-                db.session.commit()
-                
-        elif change_type == 'script_delete':
-            script_id = changes_data.get('script_id')
-            script = PeriodicScript.query.get(script_id)
-            if script and script.project_id == project_id:
-                db.session.delete(script)
-                db.session.commit()
-        
-        elif change_type == 'row_duplicate':
-            source_row_id = changes_data.get('source_row_id')
-            target_phase_number = changes_data.get('target_phase_number')
-            target_position = changes_data.get('target_position', 0)
+    # id breaks created_at ties so an unchanged list always has the same body (and ETag)
+    pending_changes = query.order_by(PendingChange.created_at.desc(), PendingChange.id.desc()).all()
+    return make_cached_json_response([pc.to_dict() for pc in pending_changes])
+
+
+def _apply_pending_change(project, pending_change, reviewed_by, now):
+    """Apply a pending change, mark it accepted and queue the user notifications
+
+    Nothing is committed; now is the request's timestamp for reviewed_at and the
+    notification timestamps. Returns (table_data, error): table_data is the
+    submission's table data for row moves and duplicates (used by the client to
+    keep the row order), error a message when a referenced row or phase is gone.
+    """
+    project_id = project.id
+    changes_data = pending_change.changes_data
+    change_type = pending_change.change_type
+    # The submission's table_data change, loaded at most once: its changes_data holds the
+    # whole table and is decoded again every time the row is fetched
+    table_data_change = None
+    
+    # Apply the change based on type
+    if change_type == 'version':
+        project.version = changes_data['new_version']
             
-            
-            # Get source row
-            source_row = Row.query.get(source_row_id)
-            if not source_row:
-                return jsonify({'error': 'Source row not found'}), 404
-            
-            # Get target phase
-            target_phase = Phase.query.filter_by(
-                project_id=project_id,
-                phase_number=target_phase_number
-            ).first()
-            if not target_phase:
-                return jsonify({'error': 'Target phase not found'}), 404
-            
-            # Create duplicate row with same data
-            new_row = Row(
-                phase_id=target_phase.id,
-                role=source_row.role,
-                time=source_row.time,
-                duration=source_row.duration,
-                description=source_row.description,
-                script=source_row.script,
-                status=source_row.status
-            )
-            db.session.add(new_row)
-            db.session.flush()
-            
-            
-            # To preserve position, get table_data from the submission and use it to reorder
-            submission_id = pending_change.submission_id
-            table_data_change = PendingChange.query.filter_by(
+    elif change_type == 'row_add':
+        phase_number = changes_data.get('phase_number')
+        phase_id = changes_data.get('phase_id')
+        row_data = changes_data.get('row_data', {})
+        
+        # Get or create phase if needed
+        if not phase_id:
+            phase = Phase.query.filter_by(
                 project_id=project_id,
-                submission_id=submission_id,
-                change_type='table_data',
-                status='pending'
+                phase_number=phase_number
             ).first()
+            if not phase:
+                phase = Phase(project_id=project_id, phase_number=phase_number, is_active=False)
+                db.session.add(phase)
+                db.session.flush()
+            phase_id = phase.id
             
-            if table_data_change:
-                table_data_json = json.loads(table_data_change.changes_data)
-                table_data = table_data_json.get('table_data')
-                
-                if table_data:
-                    # Find the target phase in table_data and update the new row's ID in table_data
-                    for phase_data in table_data:
-                        if phase_data.get('phase') == target_phase_number:
-                            phase_rows = phase_data.get('rows', [])
-                            # Update the temporary ID in table_data with the actual new row ID
-                            new_row_id_temp = changes_data.get('new_row_id')
-                            
-                            for row_data in phase_rows:
-                                row_id = row_data.get('id')
-                                # Compare as strings to handle type mismatches
-                                if str(row_id) == str(new_row_id_temp):
-                                    row_data['id'] = new_row.id
-                                    break
-                            
-                            
-                            # Update the table_data_change.changes_data with the modified table_data
-                            # so it can be retrieved later with the correct row ID
-                            table_data_json['table_data'] = table_data
-                            table_data_change.changes_data = json.dumps(table_data_json)
-                            db.session.add(table_data_change)
-                            db.session.commit()  # Commit to ensure it's saved before we retrieve it later
-                            
-                            
-                            # Note: table_data will be returned in the response and used by frontend
-                            # to preserve order. The frontend will use it instead of reloading from backend.
-                            break
-            
-            db.session.commit()
-            
-        elif change_type == 'row_move':
-            row_id = changes_data.get('row_id')
-            source_phase_number = changes_data.get('source_phase_number')
-            target_phase_number = changes_data.get('target_phase_number')
-            target_position = changes_data.get('target_position', 0)
-            
+        row = Row(
+            phase_id=phase_id,
+            role=row_data.get('role', ''),
+            time=row_data.get('time', '00:00:00'),
+            duration=row_data.get('duration', '00:00'),
+            description=row_data.get('description', ''),
+            script=row_data.get('script', ''),
+            status=row_data.get('status', 'N/A')
+        )
+        db.session.add(row)
+        
+    elif change_type == 'row_update':
+        row_id = changes_data.get('row_id')
+        new_data = changes_data.get('new_data', {})
+        
+        row = Row.query.get(row_id)
+        if row:
+            # Use raw SQL to preserve updated_at (avoid ON UPDATE CURRENT_TIMESTAMP trigger)
+            original_updated_at = row.updated_at
+            sql = """
+                UPDATE `rows` 
+                SET role = :role, time = :time, duration = :duration, 
+                    description = :description, script = :script, status = :status,
+                    updated_at = :updated_at
+                WHERE id = :row_id
+            """
+            db.session.execute(db.text(sql), {
+                'role': new_data.get('role', row.role),
+                'time': new_data.get('time', row.time),
+                'duration': new_data.get('duration', row.duration),
+                'description': new_data.get('description', row.description),
+                'script': new_data.get('script', row.script),
+                'status': new_data.get('status', row.status),
+                'updated_at': original_updated_at,
+                'row_id': row_id
+            })
+        
+    elif change_type == 'row_delete':
+        # A single DELETE; the rows are not loaded just to be removed. The default session
+        # sync drops a row another change of the same batch already loaded
+        Row.query.filter_by(id=changes_data.get('row_id')).delete()
             
-            # Get row to move
-            row = Row.query.get(row_id)
-            if not row:
-                return jsonify({'error': 'Row not found'}), 404
+    elif change_type == 'role_add':
+        role_name = changes_data.get('role')
+        # Check if role already exists (by id only, no ProjectRole object needed)
+        existing_role_id = db.session.query(ProjectRole.id).filter_by(
+            project_id=project_id,
+            role_name=role_name
+        ).scalar()
+        if existing_role_id is None:
+            role = ProjectRole(project_id=project_id, role_name=role_name)
+            db.session.add(role)
             
-            # Get target phase
-            target_phase = Phase.query.filter_by(
-                project_id=project_id,
-                phase_number=target_phase_number
-            ).first()
-            if not target_phase:
-                return jsonify({'error': 'Target phase not found'}), 404
+    elif change_type == 'role_delete':
+        ProjectRole.query.filter_by(
+            project_id=project_id,
+            role_name=changes_data.get('role')
+        ).delete()
             
-            # Move row to target phase
+    elif change_type == 'script_add':
+        script_data = changes_data.get('script_data', {})
+        script = PeriodicScript(
+            project_id=project_id,
+            name=script_data.get('name', ''),
+            path=script_data.get('path', ''),
+            status=script_data.get('status', False)
+        )
+        db.session.add(script)
+        
+    elif change_type == 'script_update':
+        script_id = changes_data.get('script_id')
+        new_data = changes_data.get('new_data', {})
+        
+        script = PeriodicScript.query.get(script_id)
+        if script and script.project_id == project_id:
+            script.name = new_data.get('name', script.name)
+            script.path = new_data.get('path', script.path)
+            script.status = new_data.get('status', script.status)
             
-            # If same phase, we need to preserve position using table_data
-            if source_phase_number == target_phase_number:
-                # Get table_data from submission to preserve order
-                submission_id = pending_change.submission_id
-                table_data_change = PendingChange.query.filter_by(
-                    project_id=project_id,
-                    submission_id=submission_id,
-                    change_type='table_data',
-                    status='pending'
-                ).first()
-                
-                if table_data_change:
-                    table_data_json = json.loads(table_data_change.changes_data)
-                    table_data = table_data_json.get('table_data')
-                    
-                    
-                    # Note: Position is preserved by frontend using table_data on reload
-                    # The phase_id doesn't change for same-phase moves, so no DB update needed
-                else:
-                    # No table_data found - this shouldn't happen, but handle gracefully
-                    pass
-            else:
-                # Different phase - update phase_id
-                row.phase_id = target_phase.id
-                row.updated_at = datetime.utcnow()
+    elif change_type == 'script_delete':
+        PeriodicScript.query.filter_by(
+            id=changes_data.get('script_id'),
+            project_id=project_id
+        ).delete()
+    
+    elif change_type == 'row_duplicate':
+        source_row_id = changes_data.get('source_row_id')
+        target_phase_number = changes_data.get('target_phase_number')
+        target_position = changes_data.get('target_position', 0)
+        
+        
+        # Get source row
+        source_row = Row.query.get(source_row_id)
+        if not source_row:
+            return None, 'Source row not found'
+        
+        # Get target phase
+        target_phase = Phase.query.filter_by(
+            project_id=project_id,
+            phase_number=target_phase_number
+        ).first()
+        if not target_phase:
+            return None, 'Target phase not found'
+        
+        # Create duplicate row with same data
+        new_row = Row(
+            phase_id=target_phase.id,
+            role=source_row.role,
+            time=source_row.time,
+            duration=source_row.duration,
+            description=source_row.description,
+            script=source_row.script,
+            status=source_row.status
+        )
+        db.session.add(new_row)
+        db.session.flush()
+        
+        
+        # To preserve position, get table_data from the submission and use it to reorder
+        submission_id = pending_change.submission_id
+        table_data_change = PendingChange.query.filter_by(
+            project_id=project_id,
+            submission_id=submission_id,
+            change_type='table_data',
+            status='pending'
+        ).first()
+        
+        if table_data_change:
+            table_data_json = table_data_change.changes_data
+            table_data = table_data_json.get('table_data')
             
-            db.session.commit()
+            if table_data:
+                # Find the target phase in table_data and update the new row's ID in table_data
+                for phase_data in table_data:
+                    if phase_data.get('phase') == target_phase_number:
+                        phase_rows = phase_data.get('rows', [])
+                        # Update the temporary ID in table_data with the actual new row ID
+                        new_row_id_temp = changes_data.get('new_row_id')
+                        
+                        for row_data in phase_rows:
+                            row_id = row_data.get('id')
+                            # Compare as strings to handle type mismatches
+                            if str(row_id) == str(new_row_id_temp):
+                                row_data['id'] = new_row.id
+                                break
+                        
+                        
+                        # Update the table_data_change.changes_data with the modified table_data
+                        # so it can be retrieved later with the correct row ID
+                        table_data_json['table_data'] = table_data
+                        flag_modified(table_data_change, 'changes_data')  # Changed in place
+                        
+                        
+                        # Note: table_data will be returned in the response and used by frontend
+                        # to preserve order. The frontend will use it instead of reloading from backend.
+                        break
         
-        # Mark change as accepted
-        pending_change.status = 'accepted'
-        if reviewed_by:
-            pending_change.reviewed_by = reviewed_by
-            pending_change.reviewed_at = datetime.utcnow()
-            db.session.commit()
         
-        # Notify all active users about the update (except the manager who made the change)
+    elif change_type == 'row_move':
+        row_id = changes_data.get('row_id')
+        source_phase_number = changes_data.get('source_phase_number')
+        target_phase_number = changes_data.get('target_phase_number')
+        target_position = changes_data.get('target_position', 0)
+        
+        
+        # Get row to move
+        row = Row.query.get(row_id)
+        if not row:
+            return None, 'Row not found'
+        
+        # Get target phase
+        target_phase = Phase.query.filter_by(
+            project_id=project_id,
+            phase_number=target_phase_number
+        ).first()
+        if not target_phase:
+            return None, 'Target phase not found'
+        
+        # Move row to target phase
+        
+        # Same phase: position is preserved by frontend using table_data on reload
+        # and the phase_id doesn't change, so no DB update needed
+        if source_phase_number != target_phase_number:
+            # Different phase - update phase_id
+            row.phase_id = target_phase.id
+        
+    
+    # Mark change as accepted
+    pending_change.status = 'accepted'
+    if reviewed_by:
+        pending_change.reviewed_by = reviewed_by
+        pending_change.reviewed_at = now
+    
+    # For row_move and row_duplicate, we don't send data_updated notifications
+    # because these changes require table_data to preserve order, and other users
+    # would reload from the backend (ordered by ID) and lose the correct order.
+    # Instead, they will get the update through the normal polling mechanism
+    # which will eventually show the changes, but without preserving order.
+    # TODO: In the future, we could include table_data in the notification.
+    reorders_rows = change_type in ('row_move', 'row_duplicate')
+    
+    # Notify all active users about the update (except the manager who made the change)
+    if not reorders_rows:
+        notification_data = dumps_json_text({
+            'change_type': change_type,
+            'message': 'Project data has been updated'
+        })
         active_users = User.query.filter_by(
             project_id=project_id,
             is_active=True
         ).all()
-        
         for user in active_users:
             if user.role != project.manager_role or user.name != reviewed_by:
-                # For row_move and row_duplicate, we don't send data_updated notifications
-                # because these changes require table_data to preserve order, and other users
-                # would reload from the backend (ordered by ID) and lose the correct order.
-                # Instead, they will get the update through the normal polling mechanism
-                # which will eventually show the changes, but without preserving order.
-                # TODO: In the future, we could include table_data in the notification.
-                if change_type not in ['row_move', 'row_duplicate']:
-                    user.notification_command = 'data_updated'
-                    user.notification_data = json.dumps({
-                        'change_type': change_type,
-                        'message': 'Project data has been updated'
-                    })
-                    user.notification_timestamp = datetime.utcnow()
-        
-        db.session.commit()
-        
-        # Check if all changes in this submission are processed
-        submission_id = pending_change.submission_id
-        
-        # Get table_data from submission if available (for preserving row order)
-        # Also mark table_data change as accepted if we're accepting row_move or row_duplicate
-        # For row_duplicate, the table_data was already modified in the handler above
-        # So we need to get it from the same source or update the stored version
-        table_data_for_response = None
-        if change_type in ['row_move', 'row_duplicate']:
+                user.notification_command = 'data_updated'
+                user.notification_data = notification_data
+                user.notification_timestamp = now
+    
+    # Check if all changes in this submission are processed
+    submission_id = pending_change.submission_id
+    
+    # Get table_data from submission if available (for preserving row order)
+    # Also mark table_data change as accepted if we're accepting row_move or row_duplicate
+    # For row_duplicate, the table_data was already modified in the handler above
+    # So we need to get it from the same source or update the stored version
+    table_data_for_response = None
+    if reorders_rows:
+        if table_data_change is None:
             table_data_change = PendingChange.query.filter_by(
                 project_id=project_id,
                 submission_id=submission_id,
                 change_type='table_data',
                 status='pending'
             ).first()
+        
+        if table_data_change:
+            table_data_json = table_data_change.changes_data
+            table_data_for_response = table_data_json.get('table_data')
             
-            if table_data_change:
-                table_data_json = json.loads(table_data_change.changes_data)
-                table_data_for_response = table_data_json.get('table_data')
-                
-                # For row_duplicate, the table_data was modified in the handler above
-                # We need to update the stored version with the modified table_data
-                # The modified table_data should be in the same object that was modified
-                # But since we're getting a fresh copy here, we need to check if it was modified
-                # Actually, the modification was done in-place on the table_data object,
-                # but we're getting a fresh copy from JSON, so the modification is lost.
-                # We need to re-apply the modification or use the modified version.
+            # For row_duplicate, this is the same object the handler above updated
+            # in place, so the table_data already carries the new row's ID
+            
+            # Mark table_data change as accepted (so it doesn't show as pending)
+            table_data_change.status = 'accepted'
+            if reviewed_by:
+                table_data_change.reviewed_by = reviewed_by
+                table_data_change.reviewed_at = now
+            
+            # Update row IDs in table_data to match current database state
+            # Also update the database with the correct row order from table_data
+            if table_data_for_response:
+                current_phases = Phase.query.filter_by(project_id=project_id).all()
+                current_phases_dict = {p.phase_number: p for p in current_phases}
+                # Load every row of the project once, grouped by phase and mapped by ID
+                rows_by_phase = {phase.id: [] for phase in current_phases}
+                all_current_rows_dict = {}
+                for row in Row.query.filter(Row.phase_id.in_(rows_by_phase)).order_by(Row.updated_at, Row.id):
+                    rows_by_phase[row.phase_id].append(row)
+                    all_current_rows_dict[row.id] = row
                 
-                # Mark table_data change as accepted (so it doesn't show as pending)
-                table_data_change.status = 'accepted'
-                if reviewed_by:
-                    table_data_change.reviewed_by = reviewed_by
-                    table_data_change.reviewed_at = datetime.utcnow()
-                db.session.commit()
+                for phase_data in table_data_for_response:
+                    phase_number = phase_data.get('phase')
+                    if phase_number in current_phases_dict:
+                        phase = current_phases_dict[phase_number]
+                        phase_data['id'] = phase.id
+                        phase_data['is_active'] = phase.is_active
+                        
+                        # Get current rows in this phase
+                        current_rows = rows_by_phase[phase.id]
+                        current_rows_dict = {r.id: r for r in current_rows}
+                        
+                        # Map table_data rows to current rows and UPDATE with current DB values
+                        # This ensures we only use table_data for ORDER, not for content
+                        # (content changes require separate row_update approval)
+                        updated_rows = []
+                        for row_data in phase_data.get('rows', []):
+                            row_id = row_data.get('id')
+                            if row_id in current_rows_dict:
+                                # Row exists in this phase - use current DB values
+                                db_row = current_rows_dict[row_id]
+                                updated_rows.append({
+                                    'id': db_row.id,
+                                    'role': db_row.role,
+                                    'time': db_row.time,
+                                    'duration': db_row.duration,
+                                    'description': db_row.description or '',
+                                    'script': db_row.script or '',
+                                    'status': db_row.status,
+                                    'script_result': db_row.script_result
+                                })
+                            elif row_id in all_current_rows_dict:
+                                # Row was moved from another phase - use current DB values
+                                db_row = all_current_rows_dict[row_id]
+                                updated_rows.append({
+                                    'id': db_row.id,
+                                    'role': db_row.role,
+                                    'time': db_row.time,
+                                    'duration': db_row.duration,
+                                    'description': db_row.description or '',
+                                    'script': db_row.script or '',
+                                    'status': db_row.status,
+                                    'script_result': db_row.script_result
+                                })
+                            else:
+                                # Try to find matching row by data (for newly created rows)
+                                matched = False
+                                for current_row in current_rows:
+                                    if (current_row.role == row_data.get('role') and
+                                        current_row.time == row_data.get('time') and
+                                        current_row.duration == row_data.get('duration') and
+                                        current_row.description == row_data.get('description', '') and
+                                        current_row.script == row_data.get('script', '') and
+                                        current_row.status == row_data.get('status', 'N/A')):
+                                        updated_rows.append({
+                                            'id': current_row.id,
+                                            'role': current_row.role,
+                                            'time': current_row.time,
+                                            'duration': current_row.duration,
+                                            'description': current_row.description or '',
+                                            'script': current_row.script or '',
+                                            'status': current_row.status,
+                                            'script_result': current_row.script_result
+                                        })
+                                        matched = True
+                                        break
+                                # If no match found, skip this row (doesn't exist in DB)
+                        phase_data['rows'] = updated_rows
                 
-                # Update row IDs in table_data to match current database state
-                # Also update the database with the correct row order from table_data
-                if table_data_for_response:
-                    current_phases = Phase.query.filter_by(project_id=project_id).all()
-                    current_phases_dict = {p.phase_number: p for p in current_phases}
-                    # Build a map of all rows by ID for easy lookup
-                    all_current_rows_dict = {}
-                    for phase in current_phases:
-                        phase_rows = Row.query.filter_by(phase_id=phase.id).all()
-                        for row in phase_rows:
-                            all_current_rows_dict[row.id] = row
-                    
-                    for phase_data in table_data_for_response:
-                        phase_number = phase_data.get('phase')
-                        if phase_number in current_phases_dict:
-                            phase = current_phases_dict[phase_number]
-                            phase_data['id'] = phase.id
-                            phase_data['is_active'] = phase.is_active
-                            
-                            # Get current rows in this phase
-                            current_rows = Row.query.filter_by(phase_id=phase.id).all()
-                            current_rows_dict = {r.id: r for r in current_rows}
-                            
-                            # Map table_data rows to current rows and UPDATE with current DB values
-                            # This ensures we only use table_data for ORDER, not for content
-                            # (content changes require separate row_update approval)
-                            updated_rows = []
-                            for row_data in phase_data.get('rows', []):
-                                row_id = row_data.get('id')
-                                if row_id in current_rows_dict:
-                                    # Row exists in this phase - use current DB values
-                                    db_row = current_rows_dict[row_id]
-                                    updated_rows.append({
-                                        'id': db_row.id,
-                                        'role': db_row.role,
-                                        'time': db_row.time,
-                                        'duration': db_row.duration,
-                                        'description': db_row.description or '',
-                                        'script': db_row.script or '',
-                                        'status': db_row.status,
-                                        'script_result': db_row.script_result
-                                    })
-                                elif row_id in all_current_rows_dict:
-                                    # Row was moved from another phase - use current DB values
-                                    db_row = all_current_rows_dict[row_id]
-                                    updated_rows.append({
-                                        'id': db_row.id,
-                                        'role': db_row.role,
-                                        'time': db_row.time,
-                                        'duration': db_row.duration,
-                                        'description': db_row.description or '',
-                                        'script': db_row.script or '',
-                                        'status': db_row.status,
-                                        'script_result': db_row.script_result
-                                    })
-                                else:
-                                    # Try to find matching row by data (for newly created rows)
-                                    matched = False
-                                    for current_row in current_rows:
-                                        if (current_row.role == row_data.get('role') and
-                                            current_row.time == row_data.get('time') and
-                                            current_row.duration == row_data.get('duration') and
-                                            current_row.description == row_data.get('description', '') and
-                                            current_row.script == row_data.get('script', '') and
-                                            current_row.status == row_data.get('status', 'N/A')):
-                                            updated_rows.append({
-                                                'id': current_row.id,
-                                                'role': current_row.role,
-                                                'time': current_row.time,
-                                                'duration': current_row.duration,
-                                                'description': current_row.description or '',
-                                                'script': current_row.script or '',
-                                                'status': current_row.status,
-                                                'script_result': current_row.script_result
-                                            })
-                                            matched = True
-                                            break
-                                    # If no match found, skip this row (doesn't exist in DB)
-                            phase_data['rows'] = updated_rows
-                    
-                    # Update the database with the correct row order from table_data
-                    # This ensures getPhases returns rows in the correct order
-                    # We update updated_at timestamps in the order they appear in table_data
-                    base_time = datetime.utcnow()
-                    for phase_data in table_data_for_response:
-                        phase_number = phase_data.get('phase')
-                        if phase_number in current_phases_dict:
-                            phase = current_phases_dict[phase_number]
-                            phase_rows = phase_data.get('rows', [])
-                            # Update updated_at for each row in order (with small increments)
-                            for position, row_data in enumerate(phase_rows):
-                                row_id = row_data.get('id')
-                                if row_id and row_id in all_current_rows_dict:
-                                    db_row = all_current_rows_dict[row_id]
-                                    # Set updated_at to base_time + position seconds
-                                    # This ensures rows are ordered by updated_at in the same order as table_data
-                                    db_row.updated_at = base_time + timedelta(seconds=position)
-                                    db.session.add(db_row)
-                    
-                    db.session.commit()
+                # Update the database with the correct row order from table_data
+                # This ensures getPhases returns rows in the correct order
+                # We update updated_at timestamps in the order they appear in table_data
+                base_time = datetime.utcnow()
+                row_updates = []
+                for phase_data in table_data_for_response:
+                    phase_number = phase_data.get('phase')
+                    if phase_number in current_phases_dict:
+                        phase_rows = phase_data.get('rows', [])
+                        # Update updated_at for each row in order (with small increments)
+                        for position, row_data in enumerate(phase_rows):
+                            row_id = row_data.get('id')
+                            if row_id and row_id in all_current_rows_dict:
+                                # Set updated_at to base_time + position seconds
+                                # This ensures rows are ordered by updated_at in the same order as table_data
+                                row_updates.append({'id': row_id, 'updated_at': base_time + timedelta(seconds=position)})
+                # The whole table's order in as few UPDATE statements as possible
+                _update_rows(row_updates)
+    
+    return table_data_for_response, None
+
+
+@api.route('/projects/<int:project_id>/pending-changes/<int:change_id>/accept', methods=['POST'])
+def accept_pending_change(project_id, change_id):
+    """Accept an individual pending change and apply it"""
+    project = Project.query.get_or_404(project_id)
+    pending_change = PendingChange.query.filter_by(
+        project_id=project_id,
+        id=change_id,
+        status='pending'
+    ).first_or_404()
+    
+    data = request.get_json()
+    reviewed_by = data.get('reviewed_by', '').strip()
+    
+    try:
+        table_data_for_response, error = _apply_pending_change(project, pending_change, reviewed_by, datetime.utcnow())
+        if error:
+            db.session.rollback()
+            return make_json_response({'error': error}, 404)
+        submission_id = pending_change.submission_id
+        
+        # The applied change, its review status and the notifications are committed together
+        db.session.commit()
         
         # Count remaining pending changes (excluding table_data which is internal metadata)
-        remaining_pending = PendingChange.query.filter(
-            PendingChange.project_id == project_id,
-            PendingChange.submission_id == submission_id,
-            PendingChange.status == 'pending',
-            PendingChange.change_type != 'table_data'
-        ).count()
+        remaining_pending = _count_remaining_pending(project_id, submission_id)
         
         # Emit real-time update to all clients
         socketio = get_socketio()
@@ -2805,24 +3032,90 @@ def accept_pending_change(project_id, change_id):
             socketio.emit('phases_updated', {'project_id': project_id}, room=f'project_{project_id}')
             socketio.emit('pending_changes_updated', {'project_id': project_id}, room=f'project_{project_id}')
         
-        return jsonify({
+        return make_json_response({
             'message': 'Change accepted',
             'submission_id': submission_id,
             'remaining_pending': remaining_pending,
             'all_processed': remaining_pending == 0,
             'table_data': table_data_for_response  # Include table_data for frontend to use
-        }), 200
+        }, 200)
         
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        return make_json_response({'error': str(e)}, 500)
 
 
-@api.route('/api/projects/<int:project_id>/pending-changes/<int:change_id>/decline', methods=['POST'])
+@api.route('/projects/<int:project_id>/pending-changes/accept-bulk', methods=['POST'])
+def accept_pending_changes_bulk(project_id):
+    """Accept several pending changes in one transaction, in the order given"""
+    project = Project.query.get_or_404(project_id)
+    data = request.get_json() or {}
+    reviewed_by = (data.get('reviewed_by') or '').strip()
+    change_ids = data.get('change_ids')
+    
+    # A non-empty list of integer ids (bool is an int subclass, so it is excluded explicitly)
+    if (not isinstance(change_ids, list) or not change_ids or
+            not all(isinstance(change_id, int) and not isinstance(change_id, bool) for change_id in change_ids)):
+        return make_json_response({'error': 'change_ids must be a non-empty list of change IDs'}, 400)
+    change_ids = list(dict.fromkeys(change_ids))
+    
+    pending_changes = PendingChange.query.filter(
+        PendingChange.project_id == project_id,
+        PendingChange.id.in_(change_ids),
+        PendingChange.status == 'pending'
+    ).all()
+    if len(pending_changes) != len(change_ids):
+        return make_json_response({'error': 'Pending change not found'}, 404)
+    position = {change_id: idx for idx, change_id in enumerate(change_ids)}
+    pending_changes.sort(key=lambda pending_change: position[pending_change.id])
+    
+    try:
+        # Changes are applied one after another, exactly as individual accepts in this
+        # order would; the last row move/duplicate's table data is the one to use
+        table_data_for_response = None
+        accepted_ids = []
+        submission_ids = set()
+        now = datetime.utcnow()
+        for pending_change in pending_changes:
+            table_data, error = _apply_pending_change(project, pending_change, reviewed_by, now)
+            if error:
+                db.session.rollback()
+                return make_json_response({'error': error, 'change_id': pending_change.id}, 404)
+            if table_data is not None:
+                table_data_for_response = table_data
+            accepted_ids.append(pending_change.id)
+            submission_ids.add(pending_change.submission_id)
+        
+        db.session.commit()
+        
+        remaining_pending = sum(_count_remaining_pending(project_id, submission_id) for submission_id in submission_ids)
+        
+        # Emit real-time update to all clients, once for the whole batch
+        socketio = get_socketio()
+        if socketio:
+            socketio.emit('phases_updated', {'project_id': project_id}, room=f'project_{project_id}')
+            socketio.emit('pending_changes_updated', {'project_id': project_id}, room=f'project_{project_id}')
+        
+        return make_json_response({
+            'message': 'Changes accepted',
+            'accepted': accepted_ids,
+            'submission_ids': sorted(submission_ids),
+            'remaining_pending': remaining_pending,
+            'all_processed': remaining_pending == 0,
+            'table_data': table_data_for_response
+        }, 200)
+        
+    except Exception as e:
+        db.session.rollback()
+        return make_json_response({'error': str(e)}, 500)
+
+
+@api.route('/projects/<int:project_id>/pending-changes/<int:change_id>/decline', methods=['POST'])
 def decline_pending_change(project_id, change_id):
     """Decline an individual pending change"""
-    project = Project.query.get_or_404(project_id)
-    pending_change = PendingChange.query.filter_by(
+    _project_exists_or_404(project_id)
+    # Declining only touches the status columns; skip decoding changes_data
+    pending_change = PendingChange.query.options(defer(PendingChange.changes_data)).filter_by(
         project_id=project_id,
         id=change_id,
         status='pending'
@@ -2832,12 +3125,12 @@ def decline_pending_change(project_id, change_id):
     reviewed_by = data.get('reviewed_by', '').strip()
     
     try:
+        now = datetime.utcnow()
         # Mark change as declined
         pending_change.status = 'declined'
         if reviewed_by:
             pending_change.reviewed_by = reviewed_by
-            pending_change.reviewed_at = datetime.utcnow()
-        db.session.commit()
+            pending_change.reviewed_at = now
         
         submission_id = pending_change.submission_id
         change_type = pending_change.change_type
@@ -2845,7 +3138,7 @@ def decline_pending_change(project_id, change_id):
         # If declining a structural change (row_move, row_duplicate), also decline table_data
         # since table_data is only meaningful with structural changes
         if change_type in ['row_move', 'row_duplicate']:
-            table_data_change = PendingChange.query.filter_by(
+            table_data_change = PendingChange.query.options(defer(PendingChange.changes_data)).filter_by(
                 project_id=project_id,
                 submission_id=submission_id,
                 change_type='table_data',
@@ -2855,16 +3148,13 @@ def decline_pending_change(project_id, change_id):
                 table_data_change.status = 'declined'
                 if reviewed_by:
                     table_data_change.reviewed_by = reviewed_by
-                    table_data_change.reviewed_at = datetime.utcnow()
-                db.session.commit()
+                    table_data_change.reviewed_at = now
+        
+        # One commit for the change and its submission's table_data
+        db.session.commit()
     
         # Check if all changes in this submission are processed (excluding table_data)
-        remaining_pending = PendingChange.query.filter(
-            PendingChange.project_id == project_id,
-            PendingChange.submission_id == submission_id,
-            PendingChange.status == 'pending',
-            PendingChange.change_type != 'table_data'
-        ).count()
+        remaining_pending = _count_remaining_pending(project_id, submission_id)
         
         # Emit real-time update to all clients
         socketio = get_socketio()
@@ -2872,7 +3162,7 @@ def decline_pending_change(project_id, change_id):
             socketio.emit('phases_updated', {'project_id': project_id}, room=f'project_{project_id}')
             socketio.emit('pending_changes_updated', {'project_id': project_id}, room=f'project_{project_id}')
         
-        return jsonify({
+        return make_json_response({
             'message': 'Change declined',
             'submission_id': submission_id,
             'remaining_pending': remaining_pending,
@@ -2881,12 +3171,12 @@ def decline_pending_change(project_id, change_id):
         
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        return make_json_response({'error': str(e)}, 500)
 
 
 # ==================== CHAT ENDPOINTS ====================
 
-@api.route('/api/chat/history/<int:project_id>', methods=['GET'])
+@api.route('/chat/history/<int:project_id>', methods=['GET'])
 def get_chat_history(project_id):
     """Get chat message history for a project"""
     try:
@@ -2895,23 +3185,23 @@ def get_chat_history(project_id):
         messages = Message.query.filter_by(project_id=project_id).order_by(Message.timestamp.asc()).all()
         
         # Serialize query results into JSON array
-        return jsonify([msg.to_dict() for msg in messages]), 200
+        return make_json_response([msg.to_dict() for msg in messages], 200)
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return make_json_response({'error': str(e)}, 500)
 
 
 # ==================== ACTION LOG ENDPOINTS ====================
 
-@api.route('/api/projects/<int:project_id>/action-logs', methods=['GET'])
+@api.route('/projects/<int:project_id>/action-logs', methods=['GET'])
 def get_action_logs(project_id):
     """Get action logs for a project (manager only)"""
-    project = Project.query.get_or_404(project_id)
+    project = _get_project_or_404(project_id)
     
     # Verify manager access
     user_role = request.args.get('user_role', '').strip()
     if not user_role or user_role != project.manager_role:
-        return jsonify({'error': 'Only managers can view action logs'}), 403
+        return make_json_response({'error': 'Only managers can view action logs'}, 403)
     
     try:
         # Get optional filters
@@ -2944,15 +3234,15 @@ def get_action_logs(project_id):
                 pass
         
         # Order by timestamp descending (most recent first)
-        logs = query.order_by(ActionLog.timestamp.desc()).all()
+        logs = query.order_by(ActionLog.timestamp.desc(), ActionLog.id.desc()).all()
         
-        return jsonify([log.to_dict() for log in logs]), 200
+        return make_json_response([log.to_dict() for log in logs], 200)
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return make_json_response({'error': str(e)}, 500)
 
 
-@api.route('/api/projects/<int:project_id>/action-logs/pdf', methods=['GET'])
+@api.route('/projects/<int:project_id>/action-logs/pdf', methods=['GET'])
 def get_action_logs_pdf(project_id):
     """Generate and download action logs as PDF (manager only)"""
     project = Project.query.get_or_404(project_id)
@@ -2960,7 +3250,7 @@ def get_action_logs_pdf(project_id):
     # Verify manager access
     user_role = request.args.get('user_role', '').strip()
     if not user_role or user_role != project.manager_role:
-        return jsonify({'error': 'Only managers can download action logs'}), 403
+        return make_json_response({'error': 'Only managers can download action logs'}, 403)
     
     try:
         from reportlab.lib import colors
@@ -2970,8 +3260,6 @@ def get_action_logs_pdf(project_id):
         from reportlab.lib.units import inch
         from reportlab.pdfbase import pdfmetrics
         from reportlab.pdfbase.ttfonts import TTFont
-        from io import BytesIO
-        import os
         try:
             from bidi.algorithm import get_display
             HAS_BIDI = True
@@ -3038,7 +3326,7 @@ def get_action_logs_pdf(project_id):
                         continue
         
         # Get action logs for the project - only from current reset epoch
-        logs = ActionLog.query.filter_by(project_id=project_id, reset_epoch=project.reset_epoch).order_by(ActionLog.timestamp.asc()).all()
+        logs = ActionLog.query.filter_by(project_id=project_id, reset_epoch=project.reset_epoch).order_by(ActionLog.timestamp.asc(), ActionLog.id.asc()).all()
         
         # Calculate row index mapping (row_id -> row_index)
         # Load all phases and rows, order by phase_number and row ID to get consistent global row index
@@ -3182,7 +3470,7 @@ def get_action_logs_pdf(project_id):
                 details_str = status_messages_he['N/A']
                 if log.action_details:
                     try:
-                        details = json.loads(log.action_details)
+                        details = log.action_details
                         if log.action_type == 'row_status_change':
                             old_status = status_messages_he.get(details.get('old_status', 'N/A'), details.get('old_status', 'N/A'))
                             new_status = status_messages_he.get(details.get('new_status', 'N/A'), details.get('new_status', 'N/A'))
@@ -3325,7 +3613,7 @@ def get_action_logs_pdf(project_id):
                             else:
                                 details_str = f"{details_text_he['Row #']}{row_index}"
                     except:
-                        details_str = log.action_details[:50]  # Truncate if not JSON
+                        details_str = str(log.action_details)[:50]  # Truncate if not a dict
                 
                 # Format script result in Hebrew
                 script_result_str = status_messages_he['N/A']
@@ -3374,47 +3662,46 @@ def get_action_logs_pdf(project_id):
         buffer.close()
         
         # Return PDF as response
-        from flask import Response
-        response = Response(pdf_data, mimetype='application/pdf')
+        response = current_app.response_class(pdf_data, mimetype='application/pdf')
         response.headers['Content-Disposition'] = f'attachment; filename=action_log_{project.name}_{datetime.utcnow().strftime("%Y%m%d_%H%M%S")}.pdf'
         return response
         
     except ImportError:
-        return jsonify({'error': 'PDF generation library (reportlab) not installed'}), 500
+        return make_json_response({'error': 'PDF generation library (reportlab) not installed'}, 500)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return make_json_response({'error': str(e)}, 500)
 
 
-@api.route('/api/projects/<int:project_id>/action-logs', methods=['DELETE'])
+@api.route('/projects/<int:project_id>/action-logs', methods=['DELETE'])
 def clear_action_logs(project_id):
     """Clear all action logs for a project (manager only)"""
-    project = Project.query.get_or_404(project_id)
+    project = _get_project_or_404(project_id)
     data = request.get_json() or {}
     
     # Verify manager access
     user_role = data.get('user_role', '').strip()
     if not user_role or user_role != project.manager_role:
-        return jsonify({'error': 'Only managers can clear action logs'}), 403
+        return make_json_response({'error': 'Only managers can clear action logs'}, 403)
     
     try:
         # Delete all action logs for this project
         deleted_count = ActionLog.query.filter_by(project_id=project_id).delete()
         db.session.commit()
         
-        return jsonify({
+        return make_json_response({
             'message': 'Action logs cleared successfully',
             'deleted_count': deleted_count
-        }), 200
+        }, 200)
         
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        return make_json_response({'error': str(e)}, 500)
 
 
-@api.route('/api/projects/<int:project_id>/reset-statuses', methods=['POST'])
+@api.route('/projects/<int:project_id>/reset-statuses', methods=['POST'])
 def reset_all_statuses(project_id):
     """Reset all row statuses to N/A and increment reset epoch (manager only)"""
-    project = Project.query.get_or_404(project_id)
+    project = _get_project_or_404(project_id)
     data = request.get_json() or {}
     
     # Verify manager access
@@ -3422,35 +3709,33 @@ def reset_all_statuses(project_id):
     user_name = data.get('user_name', '').strip()
     
     if not user_role or user_role != project.manager_role:
-        return jsonify({'error': 'Only managers can reset statuses'}), 403
+        return make_json_response({'error': 'Only managers can reset statuses'}, 403)
     
     try:
         # Increment reset epoch to start a new log session
         project.reset_epoch += 1
         new_reset_epoch = project.reset_epoch
         
-        # Get all rows for this project
-        phases = Phase.query.filter_by(project_id=project_id).all()
-        rows_count = 0
-        
-        for phase in phases:
-            rows = Row.query.filter_by(phase_id=phase.id).all()
-            for row in rows:
-                row.status = 'N/A'
-                row.updated_at = datetime.utcnow()
-                rows_count += 1
+        # Reset every row of the project in one UPDATE, without loading the rows;
+        # the MySQL dialect reports matched rows, so rows already at N/A are counted too
+        rows_count = Row.query.filter(
+            Row.phase_id.in_(select(Phase.id).where(Phase.project_id == project_id))
+        ).update(
+            {'status': 'N/A', 'updated_at': func.now()},  # Explicit: rows already at N/A have no other change
+            synchronize_session=False
+        )
         
         db.session.commit()
         
         # Log the reset_statuses action with the new reset_epoch
         ActionLogger.log_reset_statuses(project_id, user_name, user_role, rows_count, new_reset_epoch)
         
-        return jsonify({
+        return make_json_response({
             'message': 'All statuses reset successfully',
             'rows_reset': rows_count,
             'reset_epoch': new_reset_epoch
-        }), 200
+        }, 200)
         
     except Exception as e:
         db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        return make_json_response({'error': str(e)}, 500)
@@ -1,5 +1,7 @@
 # backend/config.py
 
+import os
+
 # Flask Server Configuration
 SERVER_HOST = '127.0.0.1'
 SERVER_PORT = 5000
@@ -19,3 +21,30 @@ SQLALCHEMY_DATABASE_URI = f'mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{D
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 SQLALCHEMY_ECHO = False  # Set to True for SQL query logging
 
+# Engine options passed to create_engine
+SQLALCHEMY_ENGINE_OPTIONS = {
+    'pool_size': 25,
+    'max_overflow': 25,
+    'pool_pre_ping': True,  # Drop connections MySQL closed while idle
+    'pool_recycle': 1800,  # Recycle before MySQL wait_timeout
+    'pool_use_lifo': True,  # Reuse the most recently returned connection first
+    # Keep the session time zone in UTC so server-side NOW() defaults match datetime.utcnow()
+    'connect_args': {'init_command': "SET time_zone = '+00:00'"},
+}
+
+# Response compression (Flask-Compress): JSON bodies above COMPRESS_MIN_SIZE bytes
+# are sent brotli/gzip encoded at a fast level
+COMPRESS_MIMETYPES = ['application/json']
+COMPRESS_ALGORITHM = ['br', 'gzip']
+COMPRESS_LEVEL = 4
+COMPRESS_BR_LEVEL = 4
+COMPRESS_MIN_SIZE = 1024
+
+# Background action log writer: reserved connections, max rows per INSERT
+# and how long (seconds) queued entries may wait before being flushed
+ACTION_LOG_POOL_SIZE = 2
+ACTION_LOG_BATCH_SIZE = 500
+ACTION_LOG_FLUSH_INTERVAL = 0.05
+
+# Set AUDIT_LOG=0 to disable action logging entirely (e.g. in dev/test)
+AUDIT_LOG_ENABLED = os.getenv('AUDIT_LOG', '1') == '1'
@@ -1,32 +1,66 @@
 # backend/main.py
 
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
 from flask_socketio import SocketIO, emit, join_room, leave_room
-from config import SQLALCHEMY_DATABASE_URI, SQLALCHEMY_TRACK_MODIFICATIONS, SERVER_HOST, SERVER_PORT, DEBUG
-from module import db, Project, Message
+from config import SQLALCHEMY_DATABASE_URI, SQLALCHEMY_TRACK_MODIFICATIONS, SQLALCHEMY_ENGINE_OPTIONS, SERVER_HOST, SERVER_PORT, DEBUG
+from config import COMPRESS_MIMETYPES, COMPRESS_ALGORITHM, COMPRESS_LEVEL, COMPRESS_BR_LEVEL, COMPRESS_MIN_SIZE
+from module import db, Project, Message, json_serializer
 from api import api
+from action_logger import ActionLogger
 from datetime import datetime, timezone
+import orjson
+import traceback
 
 # Initialize SocketIO (will be initialized after app creation)
 # Use 'eventlet' or 'gevent' for better async support, fallback to 'threading'
 socketio = SocketIO(cors_allowed_origins="*", async_mode='threading', logger=True, engineio_logger=True)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, used by request.get_json() and jsonify"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 def create_app():
     """Create and configure the Flask application"""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Configure database
     app.config['SQLALCHEMY_DATABASE_URI'] = SQLALCHEMY_DATABASE_URI
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = SQLALCHEMY_TRACK_MODIFICATIONS
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = dict(SQLALCHEMY_ENGINE_OPTIONS, json_serializer=json_serializer, json_deserializer=orjson.loads)
     
     # Initialize database
     db.init_app(app)
     
+    # Write action logs from a background thread
+    ActionLogger.init_app(app)
+    
     # Enable CORS for frontend
     CORS(app, resources={r"/api/*": {"origins": "*"}})
     
-    # Register API blueprint
+    # Compress large JSON responses; the cached GET endpoints send weak ETags, which
+    # Compress leaves unchanged, so an unchanged poll gets its 304 from the view
+    # before any compression
+    app.config['COMPRESS_MIMETYPES'] = COMPRESS_MIMETYPES
+    app.config['COMPRESS_ALGORITHM'] = COMPRESS_ALGORITHM
+    app.config['COMPRESS_LEVEL'] = COMPRESS_LEVEL
+    app.config['COMPRESS_BR_LEVEL'] = COMPRESS_BR_LEVEL
+    app.config['COMPRESS_MIN_SIZE'] = COMPRESS_MIN_SIZE
+    Compress(app)
+    
+    # Register API blueprint; a trailing slash on a request matches the same route
+    # instead of failing, so set this before any rule is added
+    app.url_map.strict_slashes = False
     app.register_blueprint(api)
     
     # Initialize SocketIO with app
@@ -112,7 +146,6 @@ def create_app():
             }, room=room)
         except Exception as e:
             print(f'Error in handle_request_start: {e}')
-            import traceback
             traceback.print_exc()
     
     @socketio.on('requestStop')
@@ -163,7 +196,6 @@ def create_app():
             }, room=room)
         except Exception as e:
             print(f'Error in handle_request_stop: {e}')
-            import traceback
             traceback.print_exc()
     
     @socketio.on('requestSetTime')
@@ -215,7 +247,6 @@ def create_app():
             }, room=room)
         except Exception as e:
             print(f'Error in handle_request_set_time: {e}')
-            import traceback
             traceback.print_exc()
     
     @socketio.on('requestSetTarget')
@@ -296,7 +327,6 @@ def create_app():
             }, room=room)
         except Exception as e:
             print(f'Error in handle_request_set_target: {e}')
-            import traceback
             traceback.print_exc()
     
     @socketio.on('requestClearTarget')
@@ -345,7 +375,6 @@ def create_app():
             }, room=room)
         except Exception as e:
             print(f'Error in handle_request_clear_target: {e}')
-            import traceback
             traceback.print_exc()
     
     # Chat handlers
@@ -402,7 +431,6 @@ def create_app():
         except Exception as e:
             db.session.rollback()
             print(f'Error in handle_send_message: {e}')
-            import traceback
             traceback.print_exc()
     
     # Create tables
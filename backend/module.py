@@ -3,16 +3,24 @@
 from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
+import orjson
 
 db = SQLAlchemy()
 
 
+def json_serializer(value):
+    """Serialize JSON columns with orjson; bytes are taken as already-encoded JSON"""
+    if isinstance(value, bytes):
+        return value.decode()
+    return orjson.dumps(value).decode()
+
+
 class Project(db.Model):
     """Project table"""
     __tablename__ = 'projects'
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    name = db.Column(db.String(255), nullable=False, unique=True)
+    name = db.Column(db.String(255, collation='utf8mb4_unicode_ci'), nullable=False, unique=True)
     version = db.Column(db.String(50), nullable=False, default='v1.0.0')
     manager_password_hash = db.Column(db.String(255), nullable=True)
     manager_role = db.Column(db.String(100), nullable=True)
@@ -26,14 +34,14 @@ class Project(db.Model):
     timer_target_datetime = db.Column(db.DateTime, nullable=True)  # Target datetime for countdown
     reset_epoch = db.Column(db.Integer, default=0, nullable=False)  # Tracks current reset epoch for log differentiation
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())  # Database clock (UTC session)
     
     # Relationships
-    phases = db.relationship('Phase', backref='project', lazy=True, cascade='all, delete-orphan')
-    roles = db.relationship('ProjectRole', backref='project', lazy=True, cascade='all, delete-orphan')
-    periodic_scripts = db.relationship('PeriodicScript', backref='project', lazy=True, cascade='all, delete-orphan')
-    messages = db.relationship('Message', backref='project', lazy=True, cascade='all, delete-orphan')
-    action_logs = db.relationship('ActionLog', backref='project', lazy=True, cascade='all, delete-orphan')
+    phases = db.relationship('Phase', back_populates='project', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    roles = db.relationship('ProjectRole', back_populates='project', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    periodic_scripts = db.relationship('PeriodicScript', back_populates='project', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    messages = db.relationship('Message', back_populates='project', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    action_logs = db.relationship('ActionLog', back_populates='project', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
     
     def set_manager_password(self, raw_password: str):
         if raw_password:
@@ -70,6 +78,9 @@ class ProjectRole(db.Model):
     project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False)
     role_name = db.Column(db.String(100), nullable=False)
     
+    # Relationships
+    project = db.relationship('Project', back_populates='roles')
+    
     __table_args__ = (db.UniqueConstraint('project_id', 'role_name', name='unique_project_role'),)
     
     def to_dict(self):
@@ -89,10 +100,11 @@ class Phase(db.Model):
     phase_number = db.Column(db.Integer, nullable=False)
     is_active = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())  # Database clock (UTC session)
     
     # Relationships
-    rows = db.relationship('Row', backref='phase', lazy=True, cascade='all, delete-orphan', order_by='Row.updated_at, Row.id')
+    project = db.relationship('Project', back_populates='phases')
+    rows = db.relationship('Row', back_populates='phase', lazy=True, cascade='all, delete-orphan', passive_deletes=True, order_by='Row.updated_at, Row.id')
     
     __table_args__ = (db.UniqueConstraint('project_id', 'phase_number', name='unique_project_phase'),)
     
@@ -120,7 +132,13 @@ class Row(db.Model):
     status = db.Column(db.String(50), nullable=False, default='N/A')  # Passed, Failed, N/A
     script_result = db.Column(db.Boolean, nullable=True)  # True/False/None
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())  # Database clock (UTC session)
+    
+    # Relationships
+    phase = db.relationship('Phase', back_populates='rows')
+    
+    # Matches Phase.rows filtering and ordering (phase_id, updated_at, id)
+    __table_args__ = (db.Index('idx_rows_phase_order', 'phase_id', 'updated_at', 'id'),)
     
     def to_dict(self):
         return {
@@ -140,13 +158,16 @@ class PeriodicScript(db.Model):
     __tablename__ = 'periodic_scripts'
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False, index=True)
     name = db.Column(db.String(255), nullable=False)
     path = db.Column(db.String(500), nullable=False)
     status = db.Column(db.Boolean, default=False)
     last_executed = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())  # Database clock (UTC session)
+    
+    # Relationships
+    project = db.relationship('Project', back_populates='periodic_scripts')
     
     def to_dict(self):
         return {
@@ -174,6 +195,13 @@ class User(db.Model):
     last_seen = db.Column(db.DateTime, nullable=True)  # Updated by heartbeat, used to detect stale sessions
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Logins, logouts and notifications look users up by (project_id, role, name);
+    # active-user listings and role notifications by (project_id, is_active[, role])
+    __table_args__ = (
+        db.Index('idx_users_project_role_name', 'project_id', 'role', 'name'),
+        db.Index('idx_users_project_active_role', 'project_id', 'is_active', 'role'),
+    )
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -199,7 +227,7 @@ class PendingChange(db.Model):
     submitted_by = db.Column(db.String(255), nullable=False)
     submitted_by_role = db.Column(db.String(100), nullable=False)
     change_type = db.Column(db.String(50), nullable=False)  # 'row_add', 'row_update', 'row_delete', 'version', 'role_add', 'role_delete', 'script_add', 'script_update', 'script_delete'
-    changes_data = db.Column(db.Text, nullable=False)  # JSON string
+    changes_data = db.Column(db.JSON, nullable=False)  # (De)serialized by the engine
     status = db.Column(db.String(20), nullable=False, default='pending')  # 'pending', 'accepted', 'declined'
     reviewed_by = db.Column(db.String(255), nullable=True)
     reviewed_at = db.Column(db.DateTime, nullable=True)
@@ -234,6 +262,9 @@ class Message(db.Model):
     timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    # Relationships
+    project = db.relationship('Project', back_populates='messages')
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -259,7 +290,7 @@ class RelatedDocument(db.Model):
     is_local_file = db.Column(db.Boolean, default=False, nullable=False)
     order_index = db.Column(db.Integer, default=0, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())  # Database clock (UTC session)
     
     def to_dict(self):
         return {
@@ -283,22 +314,24 @@ class ActionLog(db.Model):
     user_name = db.Column(db.String(255), nullable=False)
     user_role = db.Column(db.String(100), nullable=False)
     action_type = db.Column(db.String(50), nullable=False)  # 'row_status_change', 'script_execution', 'phase_activation'
-    action_details = db.Column(db.Text, nullable=True)  # JSON string for flexible data storage
+    action_details = db.Column(db.JSON, nullable=True)  # Flexible data storage, (de)serialized by the engine
     script_result = db.Column(db.Boolean, nullable=True)  # Only for script executions
     row_id = db.Column(db.Integer, nullable=True)  # For row-related actions
     phase_id = db.Column(db.Integer, nullable=True)  # For phase-related actions
     reset_epoch = db.Column(db.Integer, default=0, nullable=False, index=True)  # Tracks which reset epoch this log belongs to
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    timestamp = db.Column(db.DateTime, server_default=db.func.now(), nullable=False, index=True)  # Set by the database (UTC session time zone)
+    
+    # Relationships
+    project = db.relationship('Project', back_populates='action_logs')
     
     def to_dict(self):
-        import json
         return {
             'id': self.id,
             'project_id': self.project_id,
             'user_name': self.user_name,
             'user_role': self.user_role,
             'action_type': self.action_type,
-            'action_details': json.loads(self.action_details) if self.action_details else None,
+            'action_details': self.action_details,
             'script_result': self.script_result,
             'row_id': self.row_id,
             'phase_id': self.phase_id,
@@ -0,0 +1,62 @@
+# backend/row_import.py
+
+# Row normalization for project imports, kept free of Flask/SQLAlchemy and
+# fully annotated so it can be compiled with mypyc for large uploads.
+
+from sys import intern
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def parse_phase_number(value: Any) -> Optional[int]:
+    """Parse an imported phase number, returning None for blank or invalid values"""
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def parse_rows(rows_data: List[Dict[str, Any]]) -> List[Tuple[int, Dict[str, Any]]]:
+    """Keep the rows that have a usable phase number, paired with the parsed number"""
+    parsed_rows: List[Tuple[int, Dict[str, Any]]] = []
+    for row in rows_data:
+        phase_number = parse_phase_number(row.get('phase'))
+        if phase_number is not None:
+            parsed_rows.append((phase_number, row))
+    return parsed_rows
+
+
+def _intern_str(value: Any) -> Any:
+    """Intern a string value; values of any other type (e.g. a numeric time) are returned as they are"""
+    return intern(value) if isinstance(value, str) else value
+
+
+def build_row_dicts(parsed_rows: List[Tuple[int, Dict[str, Any]]],
+                    phase_id_by_num: Dict[int, int]) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Build Row insert mappings and the distinct role names from parsed rows
+
+    Empty values are replaced by the defaults. Role names are distinct ignoring
+    case, like the project_roles unique key (utf8mb4_unicode_ci); the first
+    spelling seen is kept. The short, highly repetitive fields are interned so
+    large imports share one string object per value.
+    """
+    row_dicts: List[Dict[str, Any]] = []
+    role_names: Dict[str, str] = {}
+    # The client sends only some of the fields, so a missing key is the common case;
+    # dict.get bound once per row handles that without an exception path
+    for phase_number, row in parsed_rows:
+        get = row.get
+        role = intern((get('role') or 'Role').strip() or 'Role')
+        role_names.setdefault(role.casefold(), role)
+        row_dicts.append({
+            'phase_id': phase_id_by_num[phase_number],
+            'role': role,
+            'time': _intern_str(get('time') or '00:00:00'),
+            'duration': _intern_str(get('duration') or '00:00'),
+            'description': get('description') or '',
+            'script': get('script') or '',
+            'status': _intern_str(get('status') or 'N/A'),
+            'script_result': get('scriptResult')
+        })
+    return row_dicts, list(role_names.values())
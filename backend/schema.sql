@@ -11,7 +11,7 @@
  -- Projects table
  CREATE TABLE `projects` (
    `id` INT AUTO_INCREMENT PRIMARY KEY,
-  `name` VARCHAR(255) NOT NULL UNIQUE,
+  `name` VARCHAR(255) COLLATE utf8mb4_unicode_ci NOT NULL UNIQUE,
   `version` VARCHAR(50) NOT NULL DEFAULT 'v1.0.0',
   `manager_password_hash` VARCHAR(255) NULL,
   `manager_role` VARCHAR(100) NULL,
@@ -68,7 +68,8 @@
    `updated_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
    CONSTRAINT `fk_rows_phase`
      FOREIGN KEY (`phase_id`) REFERENCES `phases`(`id`)
-     ON DELETE CASCADE
+     ON DELETE CASCADE,
+   INDEX `idx_rows_phase_order` (`phase_id`, `updated_at`, `id`)
  ) ENGINE=InnoDB;
  
 -- Periodic scripts table
@@ -83,7 +84,8 @@ CREATE TABLE `periodic_scripts` (
   `updated_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   CONSTRAINT `fk_periodic_scripts_project`
     FOREIGN KEY (`project_id`) REFERENCES `projects`(`id`)
-    ON DELETE CASCADE
+    ON DELETE CASCADE,
+  INDEX `idx_periodic_scripts_project_id` (`project_id`)
 ) ENGINE=InnoDB;
 
 -- Related documents table
@@ -115,6 +117,8 @@ CREATE TABLE `users` (
   `last_login` DATETIME NULL,
   `last_seen` DATETIME NULL,
   `created_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  INDEX `idx_users_project_role_name` (`project_id`, `role`, `name`),
+  INDEX `idx_users_project_active_role` (`project_id`, `is_active`, `role`),
   CONSTRAINT `fk_users_project`
     FOREIGN KEY (`project_id`) REFERENCES `projects`(`id`)
     ON DELETE CASCADE
@@ -131,7 +135,7 @@ CREATE TABLE `pending_changes` (
   `submitted_by` VARCHAR(255) NOT NULL,
   `submitted_by_role` VARCHAR(100) NOT NULL,
   `change_type` VARCHAR(50) NOT NULL, -- 'row_add', 'row_update', 'row_delete', 'version', 'role_add', 'role_delete', 'script_add', 'script_update', 'script_delete'
-  `changes_data` TEXT NOT NULL, -- JSON string with the changes
+  `changes_data` JSON NOT NULL, -- The changes
   `status` VARCHAR(20) NOT NULL DEFAULT 'pending', -- 'pending', 'accepted', 'declined'
   `reviewed_by` VARCHAR(255) NULL,
   `reviewed_at` DATETIME NULL,
@@ -165,7 +169,7 @@ CREATE TABLE `action_logs` (
     user_name VARCHAR(255) NOT NULL,
     user_role VARCHAR(100) NOT NULL,
     action_type VARCHAR(50) NOT NULL,
-    action_details TEXT,
+    action_details JSON,
     script_result BOOLEAN,
     row_id INT,
     phase_id INT,
@@ -188,6 +188,11 @@ export const api = {
       method: 'POST',
       body: { reviewed_by: reviewedBy },
     }),
+  acceptPendingChanges: (projectId, changeIds, reviewedBy) =>
+    request(`/api/projects/${projectId}/pending-changes/accept-bulk`, {
+      method: 'POST',
+      body: { change_ids: changeIds, reviewed_by: reviewedBy },
+    }),
   declinePendingChange: (projectId, changeId, reviewedBy) =>
     request(`/api/projects/${projectId}/pending-changes/${changeId}/decline`, {
       method: 'POST',
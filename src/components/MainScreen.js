@@ -726,52 +726,68 @@ const MainScreen = ({ project, role, name, onLogout }) => {
     };
   }, [project.id, isManager, role, name]);
 
+  // Update local state from an accept response (single or bulk)
+  const applyAcceptResponse = async (response) => {
+    // If table_data is returned, use it to update local state (preserves row order)
+    if (response.table_data) {
+      
+      // Update currentTableData with the table_data from the submission
+      // This preserves the correct row order
+      
+      setCurrentTableData(response.table_data);
+      // Use efficient manual copy instead of structuredClone (faster and more compatible)
+      setOriginalTableData(deepCloneTableData(response.table_data));
+      
+      // Also update active phases
+      const activePhasesMap = {};
+      response.table_data.forEach(phase => {
+        activePhasesMap[phase.phase] = !!phase.is_active;
+      });
+      setActivePhases(activePhasesMap);
+      
+      // Set a flag to prevent reload from data_updated notification
+      // We'll use a ref to track this
+      justAcceptedWithTableDataRef.current = true;
+      setTimeout(() => {
+        justAcceptedWithTableDataRef.current = false;
+      }, 10000); // Prevent reload for 10 seconds after accepting (increased from 5)
+    } else {
+      // No table_data - refresh from server (normal case)
+      await loadProjectData(false);
+    }
+    
+    const updatedChanges = await api.getPendingChanges(project.id, 'pending');
+    setPendingChanges(updatedChanges);
+    
+    // Auto-close modal if all changes in the submission are processed
+    if (response.all_processed) {
+      setReviewModalOpen(false);
+    }
+  };
+
   // Handle accepting a pending change
   const handleAcceptPendingChange = async (changeId) => {
     try {
       const response = await api.acceptPendingChange(project.id, changeId, name);
-      
-      // If table_data is returned, use it to update local state (preserves row order)
-      if (response.table_data) {
-        
-        // Update currentTableData with the table_data from the submission
-        // This preserves the correct row order
-        
-        setCurrentTableData(response.table_data);
-        // Use efficient manual copy instead of structuredClone (faster and more compatible)
-        setOriginalTableData(deepCloneTableData(response.table_data));
-        
-        // Also update active phases
-        const activePhasesMap = {};
-        response.table_data.forEach(phase => {
-          activePhasesMap[phase.phase] = !!phase.is_active;
-        });
-        setActivePhases(activePhasesMap);
-        
-        // Set a flag to prevent reload from data_updated notification
-        // We'll use a ref to track this
-        justAcceptedWithTableDataRef.current = true;
-        setTimeout(() => {
-          justAcceptedWithTableDataRef.current = false;
-        }, 10000); // Prevent reload for 10 seconds after accepting (increased from 5)
-      } else {
-        // No table_data - refresh from server (normal case)
-        await loadProjectData(false);
-      }
-      
-      const updatedChanges = await api.getPendingChanges(project.id, 'pending');
-      setPendingChanges(updatedChanges);
-      
-      // Auto-close modal if all changes in the submission are processed
-      if (response.all_processed) {
-        setReviewModalOpen(false);
-      }
+      await applyAcceptResponse(response);
     } catch (error) {
       console.error('Failed to accept pending change', error);
       setDataError(error.message || 'Failed to accept pending change');
     }
   };
 
+  // Handle accepting all remaining changes of a submission in one request
+  // (applied in the order shown, as if each were accepted from top to bottom)
+  const handleAcceptAllPendingChanges = async (changeIds) => {
+    try {
+      const response = await api.acceptPendingChanges(project.id, changeIds, name);
+      await applyAcceptResponse(response);
+    } catch (error) {
+      console.error('Failed to accept pending changes', error);
+      setDataError(error.message || 'Failed to accept pending changes');
+    }
+  };
+
   // Handle declining a pending change
   const handleDeclinePendingChange = async (changeId) => {
     try {
@@ -1140,6 +1156,9 @@ const MainScreen = ({ project, role, name, onLogout }) => {
                     const firstChange = changes[0];
                     const totalChanges = changes.length;
                     const processedCount = changes.filter(c => c.status !== 'pending').length;
+                    const acceptableIds = changes
+                      .filter(c => c.status === 'pending' && c.change_type !== 'table_data')
+                      .map(c => c.id);
                   
                   return (
                       <Box key={submissionId} sx={{ mb: 4, p: 2, border: '1px solid #555', borderRadius: 1, bgcolor: '#1e1e1e' }}>
@@ -1153,6 +1172,18 @@ const MainScreen = ({ project, role, name, onLogout }) => {
                           <Typography variant="body2" color="text.secondary">
                             התקדמות: {processedCount} מתוך {totalChanges} שינויים עובדו
                           </Typography>
+                          {acceptableIds.length > 1 && (
+                            <Box sx={{ display: 'flex', mt: 1, direction: 'rtl', justifyContent: 'flex-end' }}>
+                              <Button
+                                variant="contained"
+                                color="success"
+                                size="small"
+                                onClick={() => handleAcceptAllPendingChanges(acceptableIds)}
+                              >
+                                אישור הכל
+                              </Button>
+                            </Box>
+                          )}
                             </Box>
                         
                         {changes.map((change) => {